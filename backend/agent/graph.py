@@ -30,7 +30,9 @@ Observability:
 - Sentry error capture for exceptions
 """
 
+import asyncio
 import logging
+from contextlib import nullcontext
 from functools import partial
 from typing import Any
 
@@ -234,6 +236,7 @@ class F1Agent:
 
         # Memory instances (initialized lazily)
         self._user_memory = None
+        self._user_memory_lock = asyncio.Lock()
         self._session_state = None
 
         logger.info(f"F1Agent initialized with enhanced architecture (memory={enable_memory})")
@@ -241,21 +244,33 @@ class F1Agent:
     async def _get_user_memory(self):
         """Get or create user memory instance."""
         if self._user_memory is None and self.enable_memory:
-            try:
-                from memory.user_memory import UserMemory
-                self._user_memory = UserMemory(
-                    qdrant_host=self.qdrant_host,
-                    qdrant_port=self.qdrant_port,
-                    llm_provider=self.memory_llm_provider,
-                    llm_config={"ollama_base_url": self.ollama_base_url},
-                )
-                self._user_memory.initialize()
-                logger.info("UserMemory initialized")
-            except Exception as e:
-                logger.warning(f"Failed to initialize UserMemory: {e}")
-                self._user_memory = None
+            # Mem0/Qdrant/Ollama setup blocks, so it runs in a thread; the
+            # lock keeps concurrent first callers from each initializing
+            async with self._user_memory_lock:
+                if self._user_memory is None:
+                    try:
+                        from memory.user_memory import UserMemory
+                        user_memory = UserMemory(
+                            qdrant_host=self.qdrant_host,
+                            qdrant_port=self.qdrant_port,
+                            llm_provider=self.memory_llm_provider,
+                            llm_config={"ollama_base_url": self.ollama_base_url},
+                            redis_host=self.redis_host,
+                            redis_port=self.redis_port,
+                        )
+                        await asyncio.to_thread(user_memory.initialize)
+                        self._user_memory = user_memory
+                        logger.info("UserMemory initialized")
+                    except Exception as e:
+                        logger.warning(f"Failed to initialize UserMemory: {e}")
         return self._user_memory
 
+    async def warm_memory(self):
+        """Warm up the memory system so the first chat does not pay its cold start."""
+        user_memory = await self._get_user_memory()
+        if user_memory:
+            await user_memory.warmup()
+
     async def _get_session_state(self):
         """Get or create session state instance."""
         if self._session_state is None and self.enable_memory:
@@ -318,6 +333,34 @@ class F1Agent:
         Returns:
             Response dict with analysis, visualization, and metadata
         """
+        with self._memory_scope(user_id, session_id):
+            return await self._chat(
+                message,
+                session_id,
+                user_id=user_id,
+                status_callback=status_callback,
+                preprocessed=preprocessed,
+            )
+
+    def _memory_scope(self, user_id: str | None, session_id: str | None):
+        """Bind user/session for shared memory tools, if memory is available."""
+        if self.enable_memory:
+            try:
+                from memory.tools import memory_scope
+                return memory_scope(user_id, session_id)
+            except Exception as e:
+                logger.debug(f"Memory scope unavailable: {e}")
+        return nullcontext()
+
+    async def _chat(
+        self,
+        message: str,
+        session_id: str,
+        user_id: str | None = None,
+        status_callback = None,
+        preprocessed: dict | None = None,
+    ) -> dict[str, Any]:
+        """Run one chat turn (see chat)."""
         # Helper to send status if callback is provided
         async def send_status(stage: str, message: str):
             if status_callback:
@@ -4,6 +4,7 @@ F1 Race Intelligence Agent - FastAPI Application
 Main entry point for the backend API.
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -92,6 +93,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize Redis cache: {e}")
 
+    try:
+        # Warm Mem0 in the background so startup is not blocked on Ollama
+        from api.routers.chat import get_chat_agent
+        memory_warmup = asyncio.create_task(get_chat_agent().warm_memory())
+    except Exception as e:
+        memory_warmup = None
+        logger.warning(f"Failed to schedule memory warmup: {e}")
+
     print("API startup complete")
 
     yield
@@ -99,6 +108,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down API...")
 
+    if memory_warmup and not memory_warmup.done():
+        memory_warmup.cancel()
+
     # Shutdown Langfuse
     try:
         from observability.langfuse_tracer import get_tracer
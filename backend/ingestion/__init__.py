@@ -11,6 +11,8 @@ from ingestion.orchestrator import (
     IngestionConfig,
     IngestionOrchestrator,
     IngestionStats,
+    close_orchestrator,
+    get_orchestrator,
     run_ingestion,
 )
 
@@ -18,5 +20,7 @@ __all__ = [
     "IngestionConfig",
     "IngestionOrchestrator",
     "IngestionStats",
+    "close_orchestrator",
+    "get_orchestrator",
     "run_ingestion",
 ]
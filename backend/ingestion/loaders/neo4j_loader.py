@@ -94,27 +94,9 @@ class Neo4jLoader:
         )
 
         try:
+            # One write transaction per session; each entity type is a single UNWIND
             async with self.driver.session() as session:
-                # Create core entities
-                await self._create_season(session, session_data.year)
-                await self._create_circuit(session, session_data)
-                await self._create_race(session, session_data)
-
-                # Create drivers and teams from results
-                if session_data.results is not None and len(session_data.results) > 0:
-                    await self._create_drivers_and_teams(session, session_data)
-
-                    # Create race results relationships
-                    if session_data.session_type == "R":
-                        await self._create_race_results(session, session_data)
-
-                # Create stints and pit stops for race sessions
-                if (
-                    session_data.session_type == "R"
-                    and session_data.laps is not None
-                    and len(session_data.laps) > 0
-                ):
-                    await self._create_stints(session, session_data)
+                await session.execute_write(self._write_session, session_data)
 
             logger.info(f"Successfully loaded session into Neo4j")
             return True
@@ -123,18 +105,41 @@ class Neo4jLoader:
             logger.error(f"Failed to load session into Neo4j: {e}")
             return False
 
-    async def _create_season(self, session, year: int):
+    async def _write_session(self, tx, session_data: ExtractedSession):
+        """Write all nodes and relationships for a session inside one transaction."""
+        # Create core entities
+        await self._create_season(tx, session_data.year)
+        await self._create_circuit(tx, session_data)
+        await self._create_race(tx, session_data)
+
+        # Create drivers and teams from results
+        if session_data.results is not None and len(session_data.results) > 0:
+            await self._create_drivers_and_teams(tx, session_data)
+
+            # Create race results relationships
+            if session_data.session_type == "R":
+                await self._create_race_results(tx, session_data)
+
+        # Create stints and pit stops for race sessions
+        if (
+            session_data.session_type == "R"
+            and session_data.laps is not None
+            and len(session_data.laps) > 0
+        ):
+            await self._create_stints(tx, session_data)
+
+    async def _create_season(self, tx, year: int):
         """Create or merge Season node."""
-        await session.run(
+        await tx.run(
             "MERGE (s:Season {year: $year})",
             year=year,
         )
 
-    async def _create_circuit(self, session, session_data: ExtractedSession):
+    async def _create_circuit(self, tx, session_data: ExtractedSession):
         """Create or merge Circuit node."""
         circuit_id = session_data.circuit.lower().replace(" ", "_").replace("-", "_")
 
-        await session.run(
+        await tx.run(
             """
             MERGE (c:Circuit {id: $circuit_id})
             SET c.name = $name,
@@ -145,12 +150,12 @@ class Neo4jLoader:
             location=session_data.circuit,
         )
 
-    async def _create_race(self, session, session_data: ExtractedSession):
+    async def _create_race(self, tx, session_data: ExtractedSession):
         """Create Race node and connect to Season and Circuit."""
         race_id = f"{session_data.year}_{session_data.round_number}"
         circuit_id = session_data.circuit.lower().replace(" ", "_").replace("-", "_")
 
-        await session.run(
+        await tx.run(
             """
             MATCH (s:Season {year: $year})
             MATCH (c:Circuit {id: $circuit_id})
@@ -170,181 +175,208 @@ class Neo4jLoader:
             date=str(session_data.session_date) if session_data.session_date else None,
         )
 
-    async def _create_drivers_and_teams(self, session, session_data: ExtractedSession):
+    async def _create_drivers_and_teams(self, tx, session_data: ExtractedSession):
         """Create Driver and Team nodes with relationships."""
-        results = session_data.results
-
-        for _, row in results.iterrows():
+        rows = []
+        for row in session_data.results.to_dict("records"):
             driver_id = row.get("Abbreviation", "")
-            if not driver_id:
+            if not driver_id or pd.isna(driver_id):
                 continue
 
-            driver_name = row.get("FullName", driver_id)
             team_name = row.get("TeamName", "")
-            team_id = team_name.lower().replace(" ", "_").replace("-", "_") if team_name else None
+            team_name = team_name if team_name and pd.notna(team_name) else None
+            rows.append({
+                "driver_id": driver_id,
+                "driver_name": row.get("FullName", driver_id),
+                "driver_number": str(row.get("DriverNumber", "")),
+                "team_id": (
+                    team_name.lower().replace(" ", "_").replace("-", "_") if team_name else None
+                ),
+                "team_name": team_name,
+            })
+
+        if not rows:
+            return
+
+        # Create Drivers
+        await tx.run(
+            """
+            UNWIND $rows AS row
+            MERGE (d:Driver {id: row.driver_id})
+            SET d.name = row.driver_name,
+                d.abbreviation = row.driver_id,
+                d.number = row.driver_number
+            """,
+            rows=rows,
+        )
 
-            # Create Driver
-            await session.run(
-                """
-                MERGE (d:Driver {id: $driver_id})
-                SET d.name = $driver_name,
-                    d.abbreviation = $driver_id,
-                    d.number = $driver_number
-                """,
-                driver_id=driver_id,
-                driver_name=driver_name,
-                driver_number=str(row.get("DriverNumber", "")),
-            )
+        # Create Teams and DROVE_FOR relationships
+        await tx.run(
+            """
+            UNWIND $rows AS row
+            WITH row WHERE row.team_id IS NOT NULL
+            MERGE (t:Team {id: row.team_id})
+            SET t.name = row.team_name
+            WITH t, row
+            MATCH (d:Driver {id: row.driver_id})
+            MERGE (d)-[r:DROVE_FOR]->(t)
+            SET r.year = $year
+            """,
+            rows=rows,
+            year=session_data.year,
+        )
 
-            # Create Team and DROVE_FOR relationship
-            if team_id:
-                await session.run(
-                    """
-                    MERGE (t:Team {id: $team_id})
-                    SET t.name = $team_name
-                    WITH t
-                    MATCH (d:Driver {id: $driver_id})
-                    MERGE (d)-[r:DROVE_FOR]->(t)
-                    SET r.year = $year
-                    """,
-                    team_id=team_id,
-                    team_name=team_name,
-                    driver_id=driver_id,
-                    year=session_data.year,
-                )
-
-    async def _create_race_results(self, session, session_data: ExtractedSession):
+    async def _create_race_results(self, tx, session_data: ExtractedSession):
         """Create FINISHED relationships between Drivers and Race."""
         race_id = f"{session_data.year}_{session_data.round_number}"
-        results = session_data.results
 
-        for _, row in results.iterrows():
+        rows = []
+        for row in session_data.results.to_dict("records"):
             driver_id = row.get("Abbreviation", "")
-            if not driver_id:
+            if not driver_id or pd.isna(driver_id):
                 continue
 
             position = row.get("Position")
             grid = row.get("GridPosition")
             points = row.get("Points", 0)
-            status = row.get("Status", "")
+            rows.append({
+                "driver_id": driver_id,
+                "position": int(position) if pd.notna(position) else None,
+                "grid": int(grid) if pd.notna(grid) else None,
+                "points": float(points) if pd.notna(points) else 0,
+                "status": row.get("Status", ""),
+            })
+
+        if not rows:
+            return
+
+        await tx.run(
+            """
+            MATCH (r:Race {id: $race_id})
+            UNWIND $rows AS row
+            MATCH (d:Driver {id: row.driver_id})
+            MERGE (d)-[result:FINISHED]->(r)
+            SET result.position = row.position,
+                result.grid = row.grid,
+                result.points = row.points,
+                result.status = row.status
+            """,
+            race_id=race_id,
+            rows=rows,
+        )
 
-            await session.run(
+    async def _create_stints(self, tx, session_data: ExtractedSession):
+        """Create Stint nodes and PitStop nodes from lap data."""
+        race_id = f"{session_data.year}_{session_data.round_number}"
+
+        # One groupby over all drivers, ordered by driver then stint
+        stints = (
+            session_data.laps.groupby(["Driver", "Stint"], sort=True)
+            .agg(
+                start_lap=("LapNumber", "min"),
+                end_lap=("LapNumber", "max"),
+                lap_count=("LapNumber", "count"),
+                compound=("Compound", "first"),
+            )
+            .reset_index()
+        )
+
+        stint_rows = []
+        pitstop_rows = []
+        previous_driver = None
+        previous_stint_id = None
+
+        for stint in stints.to_dict("records"):
+            driver_id = stint["Driver"]
+            if driver_id != previous_driver:
+                previous_driver = driver_id
+                previous_stint_id = None
+
+            stint_num = int(stint["Stint"])
+            start_lap = int(stint["start_lap"])
+            compound = stint["compound"]
+            stint_id = f"{race_id}_{driver_id}_{stint_num}"
+
+            stint_rows.append({
+                "driver_id": driver_id,
+                "stint_id": stint_id,
+                "stint_num": stint_num,
+                "start_lap": start_lap,
+                "end_lap": int(stint["end_lap"]),
+                "lap_count": int(stint["lap_count"]),
+                "compound": compound if compound and pd.notna(compound) else None,
+            })
+
+            # Create PitStop between stints
+            if previous_stint_id and stint_num > 1:
+                pitstop_rows.append({
+                    "driver_id": driver_id,
+                    "prev_stint_id": previous_stint_id,
+                    "curr_stint_id": stint_id,
+                    "pitstop_id": f"{race_id}_{driver_id}_pit_{stint_num}",
+                    "lap": start_lap,
+                })
+
+            previous_stint_id = stint_id
+
+        if not stint_rows:
+            return
+
+        # Create TireCompound nodes
+        compounds = sorted({row["compound"] for row in stint_rows if row["compound"]})
+        if compounds:
+            await tx.run(
+                """
+                UNWIND $compounds AS compound
+                MERGE (tc:TireCompound {name: compound})
+                """,
+                compounds=compounds,
+            )
+
+        # Create Stint nodes and link them to drivers, race and tire compound
+        await tx.run(
+            """
+            MATCH (r:Race {id: $race_id})
+            UNWIND $rows AS row
+            MATCH (d:Driver {id: row.driver_id})
+            MERGE (stint:Stint {id: row.stint_id})
+            SET stint.number = row.stint_num,
+                stint.start_lap = row.start_lap,
+                stint.end_lap = row.end_lap,
+                stint.lap_count = row.lap_count,
+                stint.compound = row.compound
+            MERGE (d)-[:HAD_STINT]->(stint)
+            MERGE (stint)-[:DURING]->(r)
+            WITH stint, row WHERE row.compound IS NOT NULL
+            MATCH (tc:TireCompound {name: row.compound})
+            MERGE (stint)-[:USED_COMPOUND]->(tc)
+            """,
+            race_id=race_id,
+            rows=stint_rows,
+        )
+
+        # Create PitStops between consecutive stints
+        if pitstop_rows:
+            await tx.run(
                 """
-                MATCH (d:Driver {id: $driver_id})
                 MATCH (r:Race {id: $race_id})
-                MERGE (d)-[result:FINISHED]->(r)
-                SET result.position = $position,
-                    result.grid = $grid,
-                    result.points = $points,
-                    result.status = $status
+                UNWIND $rows AS row
+                MATCH (d:Driver {id: row.driver_id})
+                MATCH (prev:Stint {id: row.prev_stint_id})
+                MATCH (curr:Stint {id: row.curr_stint_id})
+                MERGE (ps:PitStop {id: row.pitstop_id})
+                SET ps.lap = row.lap,
+                    ps.from_compound = prev.compound,
+                    ps.to_compound = curr.compound
+                MERGE (d)-[:MADE_PITSTOP]->(ps)
+                MERGE (ps)-[:DURING]->(r)
+                MERGE (prev)-[:FOLLOWED_BY]->(ps)
+                MERGE (ps)-[:FOLLOWED_BY]->(curr)
                 """,
-                driver_id=driver_id,
                 race_id=race_id,
-                position=int(position) if pd.notna(position) else None,
-                grid=int(grid) if pd.notna(grid) else None,
-                points=float(points) if pd.notna(points) else 0,
-                status=status,
+                rows=pitstop_rows,
             )
 
-    async def _create_stints(self, session, session_data: ExtractedSession):
-        """Create Stint nodes and PitStop nodes from lap data."""
-        race_id = f"{session_data.year}_{session_data.round_number}"
-        laps = session_data.laps
-
-        # Group by driver
-        for driver_id in laps["Driver"].unique():
-            driver_laps = laps[laps["Driver"] == driver_id]
-
-            # Group by stint
-            stints = driver_laps.groupby("Stint").agg({
-                "LapNumber": ["min", "max", "count"],
-                "Compound": "first",
-            }).reset_index()
-
-            previous_stint_id = None
-
-            for _, stint_row in stints.iterrows():
-                stint_num = int(stint_row["Stint"].iloc[0] if hasattr(stint_row["Stint"], 'iloc') else stint_row["Stint"])
-                start_lap = int(stint_row[("LapNumber", "min")].iloc[0] if hasattr(stint_row[("LapNumber", "min")], 'iloc') else stint_row[("LapNumber", "min")])
-                end_lap = int(stint_row[("LapNumber", "max")].iloc[0] if hasattr(stint_row[("LapNumber", "max")], 'iloc') else stint_row[("LapNumber", "max")])
-                lap_count = int(stint_row[("LapNumber", "count")].iloc[0] if hasattr(stint_row[("LapNumber", "count")], 'iloc') else stint_row[("LapNumber", "count")])
-                compound_val = stint_row[("Compound", "first")]
-                compound = compound_val.iloc[0] if hasattr(compound_val, 'iloc') else compound_val
-
-                stint_id = f"{race_id}_{driver_id}_{stint_num}"
-
-                # Create TireCompound node
-                if compound and pd.notna(compound):
-                    await session.run(
-                        "MERGE (tc:TireCompound {name: $compound})",
-                        compound=compound,
-                    )
-
-                # Create Stint node
-                await session.run(
-                    """
-                    MATCH (d:Driver {id: $driver_id})
-                    MATCH (r:Race {id: $race_id})
-                    MERGE (stint:Stint {id: $stint_id})
-                    SET stint.number = $stint_num,
-                        stint.start_lap = $start_lap,
-                        stint.end_lap = $end_lap,
-                        stint.lap_count = $lap_count,
-                        stint.compound = $compound
-                    MERGE (d)-[:HAD_STINT]->(stint)
-                    MERGE (stint)-[:DURING]->(r)
-                    """,
-                    driver_id=driver_id,
-                    race_id=race_id,
-                    stint_id=stint_id,
-                    stint_num=stint_num,
-                    start_lap=start_lap,
-                    end_lap=end_lap,
-                    lap_count=lap_count,
-                    compound=compound if pd.notna(compound) else None,
-                )
-
-                # Link stint to tire compound
-                if compound and pd.notna(compound):
-                    await session.run(
-                        """
-                        MATCH (stint:Stint {id: $stint_id})
-                        MATCH (tc:TireCompound {name: $compound})
-                        MERGE (stint)-[:USED_COMPOUND]->(tc)
-                        """,
-                        stint_id=stint_id,
-                        compound=compound,
-                    )
-
-                # Create PitStop between stints
-                if previous_stint_id and stint_num > 1:
-                    pitstop_id = f"{race_id}_{driver_id}_pit_{stint_num}"
-
-                    await session.run(
-                        """
-                        MATCH (d:Driver {id: $driver_id})
-                        MATCH (r:Race {id: $race_id})
-                        MATCH (prev:Stint {id: $prev_stint_id})
-                        MATCH (curr:Stint {id: $curr_stint_id})
-                        MERGE (ps:PitStop {id: $pitstop_id})
-                        SET ps.lap = $lap,
-                            ps.from_compound = prev.compound,
-                            ps.to_compound = curr.compound
-                        MERGE (d)-[:MADE_PITSTOP]->(ps)
-                        MERGE (ps)-[:DURING]->(r)
-                        MERGE (prev)-[:FOLLOWED_BY]->(ps)
-                        MERGE (ps)-[:FOLLOWED_BY]->(curr)
-                        """,
-                        driver_id=driver_id,
-                        race_id=race_id,
-                        prev_stint_id=previous_stint_id,
-                        curr_stint_id=stint_id,
-                        pitstop_id=pitstop_id,
-                        lap=start_lap,
-                    )
-
-                previous_stint_id = stint_id
-
     async def get_driver_count(self) -> int:
         """Get the number of drivers in the graph."""
         async with self.driver.session() as session:
@@ -8,10 +8,13 @@ Sets up Qdrant collections for RAG:
 - past_analyses: Previous agent responses for learning
 """
 
+import asyncio
 import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams
 
@@ -28,21 +31,100 @@ EMBEDDING_DIMS = {
 # Default embedding dimension (BGE base)
 DEFAULT_EMBEDDING_DIM = 768
 
+# Max concurrent payload index requests per collection
+INDEX_WORKERS = 8
+
+# Point upload tuning: points per upsert request and in-flight requests per client
+DEFAULT_UPLOAD_BATCH_SIZE = 64
+DEFAULT_UPLOAD_CONCURRENCY = 2
+
+# Collection definitions and payload indexes (immutable, built once at import)
+_COLLECTIONS_CONFIG = {
+    "race_reports": {
+        "description": "Journalist articles and post-race analysis",
+        "payload_schema": {
+            "source": models.PayloadSchemaType.KEYWORD,
+            "url": models.PayloadSchemaType.KEYWORD,
+            "race_id": models.PayloadSchemaType.KEYWORD,
+            "season": models.PayloadSchemaType.INTEGER,
+            "drivers": models.PayloadSchemaType.KEYWORD,
+            "teams": models.PayloadSchemaType.KEYWORD,
+            "topics": models.PayloadSchemaType.KEYWORD,
+            "published_date": models.PayloadSchemaType.DATETIME,
+        },
+    },
+    "reddit_discussions": {
+        "description": "Community discussions from r/formula1",
+        "payload_schema": {
+            "post_id": models.PayloadSchemaType.KEYWORD,
+            "subreddit": models.PayloadSchemaType.KEYWORD,
+            "race_id": models.PayloadSchemaType.KEYWORD,
+            "season": models.PayloadSchemaType.INTEGER,
+            "score": models.PayloadSchemaType.INTEGER,
+            "drivers": models.PayloadSchemaType.KEYWORD,
+            "teams": models.PayloadSchemaType.KEYWORD,
+            "quality_score": models.PayloadSchemaType.FLOAT,
+        },
+    },
+    "regulations": {
+        "description": "FIA sporting and technical regulations",
+        "payload_schema": {
+            "document_type": models.PayloadSchemaType.KEYWORD,
+            "section": models.PayloadSchemaType.KEYWORD,
+            "year": models.PayloadSchemaType.INTEGER,
+            "article_number": models.PayloadSchemaType.KEYWORD,
+        },
+    },
+    "past_analyses": {
+        "description": "Previous agent analyses for learning and reference",
+        "payload_schema": {
+            "query": models.PayloadSchemaType.TEXT,
+            "query_type": models.PayloadSchemaType.KEYWORD,
+            "race_id": models.PayloadSchemaType.KEYWORD,
+            "drivers": models.PayloadSchemaType.KEYWORD,
+            "created_at": models.PayloadSchemaType.DATETIME,
+        },
+    },
+}
+
 
 class QdrantLoader:
     """Set up and manage Qdrant collections for F1 RAG."""
 
-    def __init__(self, host: str = "localhost", port: int = 6333):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6333,
+        grpc_port: int = 6334,
+        upload_batch_size: int = DEFAULT_UPLOAD_BATCH_SIZE,
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    ):
         """
         Initialize the Qdrant loader.
 
         Args:
             host: Qdrant server host
-            port: Qdrant server port
+            port: Qdrant server HTTP port
+            grpc_port: Qdrant server gRPC port (preferred for bulk operations)
+            upload_batch_size: Points per upsert request
+            upload_concurrency: Upsert requests kept in flight at once
         """
+        self.upload_batch_size = upload_batch_size
+        self.upload_concurrency = upload_concurrency
+
+        # Prefer gRPC: protobuf payloads are smaller and cheaper to parse than JSON.
         # Disable version check to support different server versions
-        self.client = QdrantClient(host=host, port=port, check_compatibility=False)
-        logger.info(f"Qdrant client initialized for {host}:{port}")
+        client_kwargs = {
+            "host": host,
+            "port": port,
+            "grpc_port": grpc_port,
+            "prefer_grpc": True,
+            "check_compatibility": False,
+        }
+        self.client = QdrantClient(**client_kwargs)
+        # Async client for bulk point uploads
+        self.async_client = AsyncQdrantClient(**client_kwargs)
+        logger.info(f"Qdrant client initialized for {host}:{grpc_port} (gRPC)")
 
     def initialize(self, embedding_dim: int = DEFAULT_EMBEDDING_DIM):
         """
@@ -53,55 +135,7 @@ class QdrantLoader:
         """
         logger.info(f"Initializing Qdrant collections with {embedding_dim}-dim vectors")
 
-        collections_config = {
-            "race_reports": {
-                "description": "Journalist articles and post-race analysis",
-                "payload_schema": {
-                    "source": models.PayloadSchemaType.KEYWORD,
-                    "url": models.PayloadSchemaType.KEYWORD,
-                    "race_id": models.PayloadSchemaType.KEYWORD,
-                    "season": models.PayloadSchemaType.INTEGER,
-                    "drivers": models.PayloadSchemaType.KEYWORD,
-                    "teams": models.PayloadSchemaType.KEYWORD,
-                    "topics": models.PayloadSchemaType.KEYWORD,
-                    "published_date": models.PayloadSchemaType.DATETIME,
-                },
-            },
-            "reddit_discussions": {
-                "description": "Community discussions from r/formula1",
-                "payload_schema": {
-                    "post_id": models.PayloadSchemaType.KEYWORD,
-                    "subreddit": models.PayloadSchemaType.KEYWORD,
-                    "race_id": models.PayloadSchemaType.KEYWORD,
-                    "season": models.PayloadSchemaType.INTEGER,
-                    "score": models.PayloadSchemaType.INTEGER,
-                    "drivers": models.PayloadSchemaType.KEYWORD,
-                    "teams": models.PayloadSchemaType.KEYWORD,
-                    "quality_score": models.PayloadSchemaType.FLOAT,
-                },
-            },
-            "regulations": {
-                "description": "FIA sporting and technical regulations",
-                "payload_schema": {
-                    "document_type": models.PayloadSchemaType.KEYWORD,
-                    "section": models.PayloadSchemaType.KEYWORD,
-                    "year": models.PayloadSchemaType.INTEGER,
-                    "article_number": models.PayloadSchemaType.KEYWORD,
-                },
-            },
-            "past_analyses": {
-                "description": "Previous agent analyses for learning and reference",
-                "payload_schema": {
-                    "query": models.PayloadSchemaType.TEXT,
-                    "query_type": models.PayloadSchemaType.KEYWORD,
-                    "race_id": models.PayloadSchemaType.KEYWORD,
-                    "drivers": models.PayloadSchemaType.KEYWORD,
-                    "created_at": models.PayloadSchemaType.DATETIME,
-                },
-            },
-        }
-
-        for collection_name, config in collections_config.items():
+        for collection_name, config in _COLLECTIONS_CONFIG.items():
             self._create_collection(collection_name, embedding_dim, config)
 
         logger.info("All Qdrant collections initialized")
@@ -131,16 +165,16 @@ class QdrantLoader:
                 ),
             )
 
-            # Create payload indexes for filtering
-            for field_name, field_type in config.get("payload_schema", {}).items():
-                try:
-                    self.client.create_payload_index(
-                        collection_name=name,
-                        field_name=field_name,
-                        field_schema=field_type,
+            # Create payload indexes for filtering (independent, so issue concurrently)
+            payload_schema = config.get("payload_schema", {})
+            if payload_schema:
+                with ThreadPoolExecutor(
+                    max_workers=min(INDEX_WORKERS, len(payload_schema))
+                ) as executor:
+                    executor.map(
+                        lambda item: self._create_payload_index(name, *item),
+                        payload_schema.items(),
                     )
-                except Exception as e:
-                    logger.debug(f"Index {field_name} may already exist: {e}")
 
             logger.info(f"Created collection '{name}': {config.get('description', '')}")
 
@@ -148,6 +182,62 @@ class QdrantLoader:
             logger.error(f"Failed to create collection '{name}': {e}")
             raise
 
+    def _create_payload_index(
+        self,
+        collection_name: str,
+        field_name: str,
+        field_type: models.PayloadSchemaType,
+    ):
+        """Create a single payload index, ignoring ones that already exist."""
+        try:
+            self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_type,
+            )
+        except Exception as e:
+            logger.debug(f"Index {field_name} may already exist: {e}")
+
+    async def upload_points_batched(
+        self,
+        collection_name: str,
+        points: Sequence[models.PointStruct],
+    ) -> int:
+        """
+        Upsert points in fixed-size batches with a bounded number of requests in flight.
+
+        Args:
+            collection_name: Target collection
+            points: Points to upsert
+
+        Returns:
+            Number of points submitted
+        """
+        semaphore = asyncio.Semaphore(self.upload_concurrency)
+
+        async def upsert_batch(batch: Sequence[models.PointStruct]):
+            async with semaphore:
+                # Don't wait for indexing; the server applies updates in order
+                await self.async_client.upsert(
+                    collection_name=collection_name,
+                    points=batch,
+                    wait=False,
+                )
+
+        batches = [
+            points[i : i + self.upload_batch_size]
+            for i in range(0, len(points), self.upload_batch_size)
+        ]
+        await asyncio.gather(*(upsert_batch(batch) for batch in batches))
+
+        logger.info(f"Uploaded {len(points)} points to '{collection_name}' in {len(batches)} batches")
+        return len(points)
+
+    async def close(self):
+        """Close the async and sync clients."""
+        await self.async_client.close()
+        self.client.close()
+
     def get_collection_info(self, name: str) -> dict:
         """Get information about a collection."""
         try:
@@ -183,7 +273,8 @@ class QdrantLoader:
     def health_check(self) -> bool:
         """Check if Qdrant is healthy."""
         try:
-            self.client.get_collections()
+            # Version-only endpoint: constant cost regardless of collection count
+            self.client.info()
             return True
         except Exception:
             return False
@@ -7,16 +7,68 @@ Provides short-term working memory for agent sessions:
 - Session metadata
 """
 
-import json
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
 
 
+# Last formatted wall-clock second, shared by all writes within that second
+_last_second = -1
+_last_iso = ""
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string with second precision.
+
+    The string is only re-formatted when the wall-clock second changes, so
+    bursts of writes reuse it instead of building a datetime each time.
+    """
+    global _last_second, _last_iso
+    second = time.time_ns() // 1_000_000_000
+    if second != _last_second:
+        _last_iso = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _last_second = second
+    return _last_iso
+
+
+def _encode_session(session: dict) -> dict[str, bytes]:
+    """
+    Encode session fields as Redis hash values.
+
+    Every value is stored as orjson, so types round-trip through
+    _decode_session; integers stay valid HINCRBY targets.
+    """
+    return {field: orjson.dumps(value) for field, value in session.items()}
+
+
+def _decode_session(data: dict[bytes, bytes]) -> dict:
+    """Rebuild a session dict from a Redis hash."""
+    return {field.decode(): orjson.loads(value) for field, value in data.items()}
+
+
+# Records new messages on an existing session hash; a missing session
+# (never created, deleted or expired) is left absent.
+# KEYS: session hash, active sessions. ARGV: message count, last_activity
+# (orjson), session TTL, active-set score, session ID
+_TOUCH_SESSION_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], 'message_count', ARGV[1])
+redis.call('HSET', KEYS[1], 'last_activity', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('ZADD', KEYS[2], ARGV[4], ARGV[5])
+return 1
+"""
+
+
 class SessionState:
     """
     Session state manager using Redis.
@@ -28,11 +80,16 @@ class SessionState:
     - Session metadata and preferences
     """
 
-    # Key prefixes
-    PREFIX_SESSION = "f1:session:"
+    # Key prefixes (sessions and contexts are hashes; the older f1:session:
+    # and f1:context: keys held a JSON string and simply expire)
+    PREFIX_SESSION = "f1:session_v2:"
     PREFIX_HISTORY = "f1:history:"
-    PREFIX_CONTEXT = "f1:context:"
+    PREFIX_CONTEXT = "f1:context_v2:"
     PREFIX_CACHE = "f1:cache:"
+    PREFIX_CACHE_KEYS = "f1:cache_keys:"  # SET of a session's cache keys
+
+    # Sorted set of session IDs scored by expiry timestamp
+    KEY_ACTIVE_SESSIONS = "f1:active_sessions"
 
     # TTLs (in seconds)
     TTL_SESSION = 86400  # 24 hours
@@ -40,6 +97,9 @@ class SessionState:
     TTL_CONTEXT = 1800   # 30 minutes
     TTL_CACHE = 600      # 10 minutes
 
+    # Most recent messages kept per session history
+    MAX_HISTORY = 200
+
     def __init__(
         self,
         redis_host: str = "localhost",
@@ -61,37 +121,46 @@ class SessionState:
         self.redis_db = redis_db
         self.redis_password = redis_password
 
-        self._client: redis.Redis | None = None
-        self._initialized = False
-
-    async def initialize(self):
-        """Initialize Redis connection."""
-        if self._initialized:
-            return
-
-        logger.info(f"Connecting to Redis at {self.redis_host}:{self.redis_port}...")
+        # Created eagerly: the client connects lazily on its first command, so
+        # methods never need an "initialized yet?" check.
+        # Payloads are orjson bytes, so responses are left undecoded
         self._client = redis.Redis(
             host=self.redis_host,
             port=self.redis_port,
             db=self.redis_db,
             password=self.redis_password,
-            decode_responses=True,
         )
 
+    @classmethod
+    async def connect(cls, **kwargs) -> "SessionState":
+        """
+        Create a SessionState and verify the Redis connection.
+
+        Args:
+            **kwargs: Constructor arguments (redis_host, redis_port, ...)
+
+        Returns:
+            Connected SessionState
+        """
+        state = cls(**kwargs)
+        await state.initialize()
+        return state
+
+    async def initialize(self):
+        """Verify the Redis connection."""
+        logger.info("Connecting to Redis at %s:%s...", self.redis_host, self.redis_port)
+
         # Test connection
         try:
             await self._client.ping()
-            self._initialized = True
             logger.info("Redis connection established")
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: %s", e)
             raise
 
     async def close(self):
         """Close Redis connection."""
-        if self._client:
-            await self._client.aclose()
-            self._initialized = False
+        await self._client.aclose()
 
     # =========================================
     # Session Management
@@ -114,22 +183,25 @@ class SessionState:
         Returns:
             Session data dict
         """
-        if not self._initialized:
-            await self.initialize()
-
+        now = _utc_now_iso()
         session_data = {
             "session_id": session_id,
             "user_id": user_id,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "last_activity": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
+            "last_activity": now,
             "message_count": 0,
             "metadata": metadata or {},
         }
 
         key = f"{self.PREFIX_SESSION}{session_id}"
-        await self._client.set(key, json.dumps(session_data), ex=self.TTL_SESSION)
-
-        logger.debug(f"Created session: {session_id}")
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=_encode_session(session_data))
+            pipe.expire(key, self.TTL_SESSION)
+            pipe.zadd(self.KEY_ACTIVE_SESSIONS, {session_id: time.time() + self.TTL_SESSION})
+            await pipe.execute()
+
+        logger.debug("Created session: %s", session_id)
         return session_data
 
     async def get_session(self, session_id: str) -> dict | None:
@@ -142,14 +214,11 @@ class SessionState:
         Returns:
             Session data or None
         """
-        if not self._initialized:
-            await self.initialize()
-
         key = f"{self.PREFIX_SESSION}{session_id}"
-        data = await self._client.get(key)
+        data = await self._client.hgetall(key)
 
         if data:
-            return json.loads(data)
+            return _decode_session(data)
         return None
 
     async def update_session(
@@ -167,17 +236,20 @@ class SessionState:
         Returns:
             Updated session data or None
         """
-        session = await self.get_session(session_id)
-        if not session:
+        key = f"{self.PREFIX_SESSION}{session_id}"
+        if not await self._client.exists(key):
             return None
 
-        session.update(updates)
-        session["last_activity"] = datetime.now(timezone.utc).isoformat()
+        updates = {**updates, "last_activity": _utc_now_iso()}
 
-        key = f"{self.PREFIX_SESSION}{session_id}"
-        await self._client.set(key, json.dumps(session), ex=self.TTL_SESSION)
+        # Only the changed fields are written; other fields are untouched server-side
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=_encode_session(updates))
+            pipe.expire(key, self.TTL_SESSION)
+            pipe.hgetall(key)
+            *_, data = await pipe.execute()
 
-        return session
+        return _decode_session(data)
 
     async def delete_session(self, session_id: str) -> bool:
         """
@@ -189,26 +261,23 @@ class SessionState:
         Returns:
             True if deleted
         """
-        if not self._initialized:
-            await self.initialize()
-
+        cache_index_key = f"{self.PREFIX_CACHE_KEYS}{session_id}"
         keys = [
             f"{self.PREFIX_SESSION}{session_id}",
             f"{self.PREFIX_HISTORY}{session_id}",
             f"{self.PREFIX_CONTEXT}{session_id}",
+            cache_index_key,
         ]
 
-        # Also delete any cache keys for this session
-        cache_pattern = f"{self.PREFIX_CACHE}{session_id}:*"
-        cache_keys = []
-        async for key in self._client.scan_iter(match=cache_pattern):
-            cache_keys.append(key)
+        # Cache keys for this session are tracked in a SET, so no keyspace SCAN
+        cache_keys = await self._client.smembers(cache_index_key)
 
-        all_keys = keys + cache_keys
-        if all_keys:
-            await self._client.delete(*all_keys)
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(*keys, *cache_keys)
+            pipe.zrem(self.KEY_ACTIVE_SESSIONS, session_id)
+            await pipe.execute()
 
-        logger.debug(f"Deleted session: {session_id}")
+        logger.debug("Deleted session: %s", session_id)
         return True
 
     # =========================================
@@ -231,24 +300,60 @@ class SessionState:
             content: Message content
             metadata: Optional message metadata
         """
-        if not self._initialized:
-            await self.initialize()
+        await self.add_messages(session_id, [
+            {"role": role, "content": content, "metadata": metadata},
+        ])
 
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "metadata": metadata or {},
-        }
+    async def add_messages(
+        self,
+        session_id: str,
+        messages: list[dict],
+    ):
+        """
+        Add several messages to session history in a single round trip.
 
-        key = f"{self.PREFIX_HISTORY}{session_id}"
-        await self._client.rpush(key, json.dumps(message))
-        await self._client.expire(key, self.TTL_HISTORY)
+        Args:
+            session_id: Session identifier
+            messages: Dicts with "role", "content" and optional "metadata"
+        """
+        if not messages:
+            return
+
+        timestamp = _utc_now_iso()
+        encoded = [
+            orjson.dumps({
+                "role": message["role"],
+                "content": message["content"],
+                "timestamp": timestamp,
+                "metadata": message.get("metadata") or {},
+            })
+            for message in messages
+        ]
 
-        # Update session message count
-        await self.update_session(session_id, {
-            "message_count": await self._client.llen(key)
-        })
+        key = f"{self.PREFIX_HISTORY}{session_id}"
+        session_key = f"{self.PREFIX_SESSION}{session_id}"
+
+        # One round trip: push + cap history, and bump the session hash
+        # server-side. Only create_session() creates sessions; the hash is
+        # updated only if it exists. The script is sent with EVAL rather than
+        # as a registered Script: a pipeline holding a Script checks the
+        # script cache (SCRIPT EXISTS) before every execute
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, *encoded)
+            pipe.ltrim(key, -self.MAX_HISTORY, -1)
+            pipe.expire(key, self.TTL_HISTORY)
+            pipe.eval(
+                _TOUCH_SESSION_LUA,
+                2,
+                session_key,
+                self.KEY_ACTIVE_SESSIONS,
+                len(encoded),
+                orjson.dumps(timestamp),
+                self.TTL_SESSION,
+                time.time() + self.TTL_SESSION,
+                session_id,
+            )
+            await pipe.execute()
 
     async def get_history(
         self,
@@ -265,13 +370,10 @@ class SessionState:
         Returns:
             List of messages
         """
-        if not self._initialized:
-            await self.initialize()
-
         key = f"{self.PREFIX_HISTORY}{session_id}"
         messages = await self._client.lrange(key, -limit, -1)
 
-        return [json.loads(m) for m in messages]
+        return [orjson.loads(m) for m in messages]
 
     async def clear_history(self, session_id: str):
         """
@@ -280,9 +382,6 @@ class SessionState:
         Args:
             session_id: Session identifier
         """
-        if not self._initialized:
-            await self.initialize()
-
         key = f"{self.PREFIX_HISTORY}{session_id}"
         await self._client.delete(key)
 
@@ -299,17 +398,20 @@ class SessionState:
         Set current working context.
 
         This stores the current analysis state, entities being discussed,
-        and other temporary context.
+        and other temporary context. Each top-level key is a field of a
+        Redis hash so that single keys can be read or updated in place.
 
         Args:
             session_id: Session identifier
             context: Context data
         """
-        if not self._initialized:
-            await self.initialize()
-
         key = f"{self.PREFIX_CONTEXT}{session_id}"
-        await self._client.set(key, json.dumps(context), ex=self.TTL_CONTEXT)
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if context:
+                pipe.hset(key, mapping={k: orjson.dumps(v) for k, v in context.items()})
+                pipe.expire(key, self.TTL_CONTEXT)
+            await pipe.execute()
 
     async def get_context(self, session_id: str) -> dict | None:
         """
@@ -321,16 +423,38 @@ class SessionState:
         Returns:
             Context data or None
         """
-        if not self._initialized:
-            await self.initialize()
-
         key = f"{self.PREFIX_CONTEXT}{session_id}"
-        data = await self._client.get(key)
+        data = await self._client.hgetall(key)
 
         if data:
-            return json.loads(data)
+            return {k.decode(): orjson.loads(v) for k, v in data.items()}
         return None
 
+    async def get_context_fields(
+        self,
+        session_id: str,
+        fields: list[str],
+    ) -> dict:
+        """
+        Get selected working context keys with a single HMGET.
+
+        Args:
+            session_id: Session identifier
+            fields: Context keys to read
+
+        Returns:
+            Mapping of the requested keys that are set
+        """
+        if not fields:
+            return {}
+        key = f"{self.PREFIX_CONTEXT}{session_id}"
+        values = await self._client.hmget(key, fields)
+        return {
+            field: orjson.loads(value)
+            for field, value in zip(fields, values, strict=True)
+            if value is not None
+        }
+
     async def update_context(
         self,
         session_id: str,
@@ -346,10 +470,32 @@ class SessionState:
         Returns:
             Updated context
         """
-        context = await self.get_context(session_id) or {}
-        context.update(updates)
-        await self.set_context(session_id, context)
-        return context
+        return await self.update_context_batch(session_id, updates)
+
+    async def update_context_batch(
+        self,
+        session_id: str,
+        values: dict,
+    ) -> dict:
+        """
+        Write several context keys in one round-trip.
+
+        Args:
+            session_id: Session identifier
+            values: Fields to update/add
+
+        Returns:
+            Updated context
+        """
+        key = f"{self.PREFIX_CONTEXT}{session_id}"
+        async with self._client.pipeline(transaction=False) as pipe:
+            if values:
+                pipe.hset(key, mapping={k: orjson.dumps(v) for k, v in values.items()})
+                pipe.expire(key, self.TTL_CONTEXT)
+            pipe.hgetall(key)
+            results = await pipe.execute()
+
+        return {k.decode(): orjson.loads(v) for k, v in results[-1].items()}
 
     # =========================================
     # Temporary Cache
@@ -371,15 +517,13 @@ class SessionState:
             value: Value to cache (will be JSON serialized)
             ttl: Optional TTL override
         """
-        if not self._initialized:
-            await self.initialize()
-
         cache_key = f"{self.PREFIX_CACHE}{session_id}:{key}"
-        await self._client.set(
-            cache_key,
-            json.dumps(value),
-            ex=ttl or self.TTL_CACHE,
-        )
+        cache_index_key = f"{self.PREFIX_CACHE_KEYS}{session_id}"
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(cache_key, orjson.dumps(value), ex=ttl or self.TTL_CACHE)
+            pipe.sadd(cache_index_key, cache_key)
+            pipe.expire(cache_index_key, self.TTL_SESSION)
+            await pipe.execute()
 
     async def cache_get(
         self,
@@ -396,14 +540,11 @@ class SessionState:
         Returns:
             Cached value or None
         """
-        if not self._initialized:
-            await self.initialize()
-
         cache_key = f"{self.PREFIX_CACHE}{session_id}:{key}"
         data = await self._client.get(cache_key)
 
         if data:
-            return json.loads(data)
+            return orjson.loads(data)
         return None
 
     async def cache_delete(
@@ -418,11 +559,11 @@ class SessionState:
             session_id: Session identifier
             key: Cache key
         """
-        if not self._initialized:
-            await self.initialize()
-
         cache_key = f"{self.PREFIX_CACHE}{session_id}:{key}"
-        await self._client.delete(cache_key)
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(cache_key)
+            pipe.srem(f"{self.PREFIX_CACHE_KEYS}{session_id}", cache_key)
+            await pipe.execute()
 
     # =========================================
     # Utility Methods
@@ -430,36 +571,31 @@ class SessionState:
 
     async def extend_session_ttl(self, session_id: str):
         """Extend session TTL on activity."""
-        if not self._initialized:
-            await self.initialize()
-
         keys = [
             f"{self.PREFIX_SESSION}{session_id}",
             f"{self.PREFIX_HISTORY}{session_id}",
         ]
 
-        for key in keys:
-            await self._client.expire(key, self.TTL_SESSION)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.expire(key, self.TTL_SESSION)
+            pipe.zadd(self.KEY_ACTIVE_SESSIONS, {session_id: time.time() + self.TTL_SESSION})
+            await pipe.execute()
 
     async def get_active_sessions(self) -> list[str]:
         """Get list of active session IDs."""
-        if not self._initialized:
-            await self.initialize()
-
-        session_ids = []
-        pattern = f"{self.PREFIX_SESSION}*"
-
-        async for key in self._client.scan_iter(match=pattern):
-            session_id = key.replace(self.PREFIX_SESSION, "")
-            session_ids.append(session_id)
+        now = time.time()
+        async with self._client.pipeline(transaction=True) as pipe:
+            # Prune sessions whose TTL has lapsed, then read the live ones
+            pipe.zremrangebyscore(self.KEY_ACTIVE_SESSIONS, "-inf", now)
+            pipe.zrangebyscore(self.KEY_ACTIVE_SESSIONS, now, "+inf")
+            _, session_ids = await pipe.execute()
 
-        return session_ids
+        return [session_id.decode() for session_id in session_ids]
 
     async def health_check(self) -> bool:
         """Check if Redis connection is healthy."""
         try:
-            if not self._initialized:
-                return False
             await self._client.ping()
             return True
         except Exception:
@@ -477,9 +613,8 @@ async def get_session_state(
     """Get or create the global SessionState instance."""
     global _session_state
     if _session_state is None:
-        _session_state = SessionState(
+        _session_state = await SessionState.connect(
             redis_host=redis_host,
             redis_port=redis_port,
         )
-        await _session_state.initialize()
     return _session_state
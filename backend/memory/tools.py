@@ -6,17 +6,43 @@ Provides LangChain-compatible tools for:
 - Managing session context
 """
 
+import asyncio
+import io
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
-from memory.user_memory import UserMemory
+from memory.user_memory import UserMemory, memory_span
 from memory.session_state import SessionState
 
 logger = logging.getLogger(__name__)
 
+# Request-scoped identity read by shared MemoryTools instances
+CURRENT_USER: ContextVar[str | None] = ContextVar("memory_user_id", default=None)
+CURRENT_SESSION: ContextVar[str | None] = ContextVar("memory_session_id", default=None)
+
+_FACT_TEMPLATE = "I learned that: {}"
+_FACT_META = {"source": "agent_observation"}
+
+
+def _noop(**kwargs):
+    """Sync placeholder for async-only tools."""
+    return None
+
+
+def _format_memories(query: str, memories: list[tuple[str, float]]) -> str:
+    """Format recalled memories as a numbered list under a header."""
+    buf = io.StringIO()
+    buf.write(f"User memories related to '{query}':")
+    for i, (memory_text, score) in enumerate(memories, 1):
+        buf.write(f"\n{i}. {memory_text} (relevance: {score:.2f})")
+    return buf.getvalue()
+
 
 # =========================================
 # Tool Input Schemas
@@ -29,13 +55,17 @@ class RecallPreferencesInput(BaseModel):
     query: str = Field(
         description="What to search for in user memories (e.g., 'favorite driver', 'preferred analysis style')"
     )
+    scope: str = Field(
+        default="all",
+        description="'all' for everything known about the user, 'session' for facts learned in this session only",
+    )
 
 
 class StoreFactInput(BaseModel):
     """Input for storing a fact about the user."""
 
-    fact: str = Field(
-        description="The fact to remember about the user (e.g., 'User supports Ferrari', 'User prefers detailed tire analysis')"
+    facts: list[str] = Field(
+        description="Facts to remember about the user (e.g., ['User supports Ferrari', 'User prefers detailed tire analysis'])"
     )
 
 
@@ -48,11 +78,23 @@ class GetContextInput(BaseModel):
     )
 
 
+class PrimeContextInput(BaseModel):
+    """Input for fetching memories and session context together."""
+
+    query: str = Field(
+        description="What to search for in user memories alongside the session context"
+    )
+
+
 class UpdateContextInput(BaseModel):
     """Input for updating session context."""
 
-    key: str = Field(description="Context key to update")
-    value: Any = Field(description="Value to store")
+    key: str | None = Field(default=None, description="Context key to update")
+    value: Any = Field(default=None, description="Value to store")
+    values: dict[str, Any] | None = Field(
+        default=None,
+        description="Several context keys to update at once (e.g. drivers, race, session)",
+    )
 
 
 # =========================================
@@ -70,6 +112,48 @@ class MemoryTools:
     - Maintain working context within a session
     """
 
+    # (tool name, description, args schema, coroutine method name)
+    _TOOL_SPECS = [
+        (
+            "recall_user_preferences",
+            "Search user's long-term memory for preferences, facts, and past interactions. "
+            "Use this to personalize responses based on what you know about the user. "
+            "Example queries: 'favorite driver', 'preferred teams', 'analysis preferences'",
+            RecallPreferencesInput,
+            "recall_preferences",
+        ),
+        (
+            "store_user_fact",
+            "Store one or more facts or preferences about the user for future reference. "
+            "Use this when the user explicitly states a preference or you learn something "
+            "important about them. Examples: 'User supports Ferrari', 'User prefers lap-by-lap analysis'",
+            StoreFactInput,
+            "store_fact",
+        ),
+        (
+            "get_session_context",
+            "Get the current session's working context. This includes drivers being discussed, "
+            "current race/session, analysis type, and other temporary state.",
+            GetContextInput,
+            "get_session_context",
+        ),
+        (
+            "update_session_context",
+            "Update the current session's working context. Use this to track entities "
+            "being discussed, current analysis focus, etc.",
+            UpdateContextInput,
+            "update_session_context",
+        ),
+        (
+            "prime_memory_context",
+            "Fetch the user's relevant long-term memories and the current session context "
+            "in one call. Prefer this over calling recall_user_preferences and "
+            "get_session_context separately at the start of a turn.",
+            PrimeContextInput,
+            "prime_context",
+        ),
+    ]
+
     def __init__(
         self,
         user_memory: UserMemory,
@@ -88,23 +172,35 @@ class MemoryTools:
         """
         self.user_memory = user_memory
         self.session_state = session_state
-        self.user_id = user_id
-        self.session_id = session_id
+        self._user_id = user_id
+        self._session_id = session_id
+        self._tools: list[StructuredTool] | None = None
+
+    @property
+    def user_id(self) -> str | None:
+        """Bound user ID, else the one set for the current request."""
+        return self._user_id or CURRENT_USER.get()
+
+    @property
+    def session_id(self) -> str | None:
+        """Bound session ID, else the one set for the current request."""
+        return self._session_id or CURRENT_SESSION.get()
 
     def set_user_id(self, user_id: str):
         """Set the current user ID."""
-        self.user_id = user_id
+        self._user_id = user_id
 
     def set_session_id(self, session_id: str):
         """Set the current session ID."""
-        self.session_id = session_id
+        self._session_id = session_id
 
-    async def recall_preferences(self, query: str) -> str:
+    async def recall_preferences(self, query: str, scope: str = "all") -> str:
         """
         Recall user preferences and facts from long-term memory.
 
         Args:
             query: What to search for
+            scope: 'all' or 'session' to only recall facts from this session
 
         Returns:
             Formatted string of relevant memories
@@ -113,39 +209,35 @@ class MemoryTools:
             return "No user context available - cannot recall preferences."
 
         try:
+            filters = None
+            if scope == "session" and self.session_id:
+                filters = {"session_id": self.session_id}
+
             memories = await self.user_memory.search_memories(
                 user_id=self.user_id,
                 query=query,
                 limit=5,
+                filters=filters,
             )
 
             if not memories:
                 return f"No memories found related to: {query}"
 
-            result_parts = [f"User memories related to '{query}':"]
-            for i, mem in enumerate(memories, 1):
-                # Handle both string and dict return types from Mem0
-                if isinstance(mem, str):
-                    memory_text = mem
-                    score = 0
-                else:
-                    memory_text = mem.get("memory", mem.get("text", str(mem)))
-                    score = mem.get("score", 0)
-                if memory_text:
-                    result_parts.append(f"{i}. {memory_text} (relevance: {score:.2f})")
-
-            return "\n".join(result_parts)
+            return _format_memories(query, memories)
 
         except Exception as e:
-            logger.error(f"Error recalling preferences: {e}")
+            logger.error("Error recalling preferences: %s", e)
             return f"Error retrieving memories: {str(e)}"
 
-    async def store_fact(self, fact: str) -> str:
+    async def store_fact(self, facts: list[str]) -> str:
         """
-        Store a fact about the user for future reference.
+        Store facts about the user for future reference.
+
+        All facts go to Mem0 in a single add, and concurrent calls are
+        coalesced, so the extraction pass is shared across facts.
 
         Args:
-            fact: The fact to remember
+            facts: The facts to remember
 
         Returns:
             Confirmation message
@@ -153,24 +245,34 @@ class MemoryTools:
         if not self.user_id:
             return "No user context available - cannot store fact."
 
+        facts = [fact for fact in facts if fact]
+        if not facts:
+            return "No facts provided."
+
         try:
-            # Store as a simple user message that Mem0 will extract facts from
+            # Store as assistant messages that Mem0 will extract facts from
             messages = [
-                {"role": "assistant", "content": f"I learned that: {fact}"},
+                {"role": "assistant", "content": _FACT_TEMPLATE.format(fact)}
+                for fact in facts
             ]
 
-            result = await self.user_memory.add_memory(
+            metadata = _FACT_META
+            if self.session_id:
+                metadata = {**_FACT_META, "session_id": self.session_id}
+
+            result = await self.user_memory.enqueue_memory(
                 user_id=self.user_id,
                 messages=messages,
-                metadata={"source": "agent_observation"},
+                metadata=metadata,
             )
 
+            stored = "; ".join(facts)
             if result:
-                return f"Remembered: {fact}"
-            return f"Stored fact: {fact}"
+                return f"Remembered: {stored}"
+            return f"Stored fact: {stored}"
 
         except Exception as e:
-            logger.error(f"Error storing fact: {e}")
+            logger.error("Error storing fact: %s", e)
             return f"Error storing fact: {str(e)}"
 
     async def get_session_context(self, context_type: str = "all") -> str:
@@ -187,30 +289,90 @@ class MemoryTools:
             return "No session context available."
 
         try:
-            context = await self.session_state.get_context(self.session_id)
+            if context_type != "all":
+                with memory_span("redis.get_context", f"session={self.session_id}"):
+                    fields = await self.session_state.get_context_fields(
+                        self.session_id, [context_type]
+                    )
+                if context_type in fields:
+                    return f"{context_type}: {fields[context_type]}"
+                return f"No '{context_type}' in session context."
+
+            with memory_span("redis.get_context", f"session={self.session_id}"):
+                context = await self.session_state.get_context(self.session_id)
 
             if not context:
                 return "No context set for this session."
 
-            if context_type == "all":
-                return f"Session context: {context}"
+            return f"Session context: {context}"
 
-            if context_type in context:
-                return f"{context_type}: {context[context_type]}"
+        except Exception as e:
+            logger.error("Error getting context: %s", e)
+            return f"Error retrieving context: {str(e)}"
 
-            return f"No '{context_type}' in session context."
+    async def prime_context(self, query: str) -> str:
+        """
+        Fetch user memories and session context in a single round.
+
+        The Qdrant search and the Redis read are issued concurrently, so the
+        cost is the slower of the two rather than their sum.
+
+        Args:
+            query: What to search for in user memories
+
+        Returns:
+            Formatted block with memories and session context
+        """
+        if not self.user_id and not self.session_id:
+            return "No user or session context available."
+
+        async def no_result():
+            return None
+
+        try:
+            memories, context = await asyncio.gather(
+                self.user_memory.search_memories(
+                    user_id=self.user_id,
+                    query=query,
+                    limit=5,
+                )
+                if self.user_id
+                else no_result(),
+                self.session_state.get_context(self.session_id)
+                if self.session_id
+                else no_result(),
+            )
+
+            result_parts = []
+            if memories:
+                result_parts.append(_format_memories(query, memories))
+            else:
+                result_parts.append(f"No memories found related to: {query}")
+
+            if context:
+                result_parts.append(f"Session context: {context}")
+            else:
+                result_parts.append("No context set for this session.")
+
+            return "\n".join(result_parts)
 
         except Exception as e:
-            logger.error(f"Error getting context: {e}")
-            return f"Error retrieving context: {str(e)}"
+            logger.error("Error priming context: %s", e)
+            return f"Error retrieving memory context: {str(e)}"
 
-    async def update_session_context(self, key: str, value: Any) -> str:
+    async def update_session_context(
+        self,
+        key: str | None = None,
+        value: Any = None,
+        values: dict[str, Any] | None = None,
+    ) -> str:
         """
         Update session context with new information.
 
         Args:
             key: Context key
             value: Value to store
+            values: Several keys to store in one round-trip
 
         Returns:
             Confirmation message
@@ -218,74 +380,71 @@ class MemoryTools:
         if not self.session_id:
             return "No session available - cannot update context."
 
+        updates = dict(values or {})
+        if key is not None:
+            updates[key] = value
+        if not updates:
+            return "No context values provided."
+
         try:
-            await self.session_state.update_context(
-                self.session_id,
-                {key: value},
-            )
-            return f"Updated context: {key} = {value}"
+            with memory_span(
+                "redis.update_context", f"session={self.session_id}", keys=len(updates)
+            ):
+                await self.session_state.update_context_batch(self.session_id, updates)
+            return "Updated context: " + ", ".join(f"{k} = {v}" for k, v in updates.items())
 
         except Exception as e:
-            logger.error(f"Error updating context: {e}")
+            logger.error("Error updating context: %s", e)
             return f"Error updating context: {str(e)}"
 
     def get_tools(self) -> list[StructuredTool]:
         """
         Get list of LangChain-compatible tools.
 
+        Tools are built once per instance from _TOOL_SPECS and reused.
+
         Returns:
             List of StructuredTool objects
         """
-        return [
-            StructuredTool(
-                name="recall_user_preferences",
-                description=(
-                    "Search user's long-term memory for preferences, facts, and past interactions. "
-                    "Use this to personalize responses based on what you know about the user. "
-                    "Example queries: 'favorite driver', 'preferred teams', 'analysis preferences'"
-                ),
-                func=lambda **kwargs: None,  # Sync placeholder
-                coroutine=self.recall_preferences,
-                args_schema=RecallPreferencesInput,
-            ),
-            StructuredTool(
-                name="store_user_fact",
-                description=(
-                    "Store a fact or preference about the user for future reference. "
-                    "Use this when the user explicitly states a preference or you learn something "
-                    "important about them. Examples: 'User supports Ferrari', 'User prefers lap-by-lap analysis'"
-                ),
-                func=lambda **kwargs: None,
-                coroutine=self.store_fact,
-                args_schema=StoreFactInput,
-            ),
-            StructuredTool(
-                name="get_session_context",
-                description=(
-                    "Get the current session's working context. This includes drivers being discussed, "
-                    "current race/session, analysis type, and other temporary state."
-                ),
-                func=lambda **kwargs: None,
-                coroutine=self.get_session_context,
-                args_schema=GetContextInput,
-            ),
-            StructuredTool(
-                name="update_session_context",
-                description=(
-                    "Update the current session's working context. Use this to track entities "
-                    "being discussed, current analysis focus, etc."
-                ),
-                func=lambda **kwargs: None,
-                coroutine=self.update_session_context,
-                args_schema=UpdateContextInput,
-            ),
-        ]
+        if self._tools is None:
+            self._tools = [
+                StructuredTool(
+                    name=name,
+                    description=description,
+                    func=_noop,  # Sync placeholder
+                    coroutine=getattr(self, method_name),
+                    args_schema=args_schema,
+                )
+                for name, description, args_schema, method_name in self._TOOL_SPECS
+            ]
+        return self._tools
 
 
 # =========================================
 # Convenience Functions
 # =========================================
 
+# Process-wide tools that resolve user/session from CURRENT_USER/CURRENT_SESSION
+_shared_tools: MemoryTools | None = None
+
+
+@contextmanager
+def memory_scope(user_id: str | None, session_id: str | None) -> Iterator[None]:
+    """
+    Bind the user and session seen by shared memory tools for a request.
+
+    Args:
+        user_id: Current user ID
+        session_id: Current session ID
+    """
+    user_token = CURRENT_USER.set(user_id)
+    session_token = CURRENT_SESSION.set(session_id)
+    try:
+        yield
+    finally:
+        CURRENT_SESSION.reset(session_token)
+        CURRENT_USER.reset(user_token)
+
 
 async def create_memory_tools(
     user_memory: UserMemory,
@@ -296,15 +455,28 @@ async def create_memory_tools(
     """
     Create memory tools for the agent.
 
+    Without an explicit user_id/session_id, the process-wide tools are
+    returned and read both from memory_scope() at call time.
+
     Args:
         user_memory: UserMemory instance
         session_state: SessionState instance
-        user_id: Optional user ID
-        session_id: Optional session ID
+        user_id: Optional user ID to bind permanently
+        session_id: Optional session ID to bind permanently
 
     Returns:
         List of LangChain tools
     """
+    global _shared_tools
+    if user_id is None and session_id is None:
+        if (
+            _shared_tools is None
+            or _shared_tools.user_memory is not user_memory
+            or _shared_tools.session_state is not session_state
+        ):
+            _shared_tools = MemoryTools(user_memory, session_state)
+        return _shared_tools.get_tools()
+
     factory = MemoryTools(
         user_memory=user_memory,
         session_state=session_state,
@@ -4,13 +4,258 @@ Provides long-term memory for user preferences, facts, and conversation context.
 Uses Qdrant for vector storage and supports multiple LLM backends.
 """
 
+import asyncio
+import functools
+import hashlib
+import io
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
 from typing import Any
 
+import numpy as np
+import orjson
+import redis.asyncio as redis
 from mem0 import Memory
+from qdrant_client import QdrantClient
+from qdrant_client.http import models
 
 logger = logging.getLogger(__name__)
 
+# Observability imports (optional - graceful degradation)
+try:
+    from observability.sentry_integration import span
+    SENTRY_AVAILABLE = True
+except ImportError:
+    SENTRY_AVAILABLE = False
+
+
+def memory_span(operation: str, description: str, **data: Any):
+    """
+    Trace an external memory call as a Sentry span, if Sentry is available.
+
+    Args:
+        operation: Span operation (e.g. "mem0.search", "redis.get_context")
+        description: Human-readable description
+        **data: Span data for slicing (user_id, limit, query_len, ...)
+
+    Returns:
+        Span context manager, or a no-op one without Sentry
+    """
+    if SENTRY_AVAILABLE:
+        return span(operation, description, data)
+    return nullcontext()
+
+EMBED_CACHE_SIZE = int(os.getenv("MEM0_EMBED_CACHE_SIZE", "4096"))
+EMBED_CACHE_TTL = float(os.getenv("MEM0_EMBED_CACHE_TTL", "900"))
+
+# Cap on concurrent Mem0 calls that hit Ollama (match OLLAMA_NUM_PARALLEL)
+MAX_CONCURRENCY = int(os.getenv("MEM0_MAX_CONCURRENCY", "4"))
+
+# Broad recalls (limit above this) are reranked locally with NumPy
+RERANK_MIN_LIMIT = 5
+RERANK_MAX_CANDIDATES = 256
+
+# int8 scalar quantization for the memories collection; Qdrant rescores
+# candidates against the original vectors by default
+QUANTIZATION_CONFIG = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(
+        type=models.ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True,
+    )
+)
+
+# store_fact calls are coalesced into one Mem0 add (one LLM extraction pass)
+ADD_BATCH_SIZE = 8
+ADD_BATCH_DELAY = 0.25
+
+# Redis snapshot of each user's most recent facts, served when context is
+# requested without a query (nothing to rank against)
+SNAPSHOT_PREFIX = "mem:snap:"
+SNAPSHOT_SIZE = 5
+SNAPSHOT_TTL = 3600
+
+# Redis semantic cache of recent get_user_context results per user. Entries
+# are packed as int8 unit-vector bytes followed by the UTF-8 context.
+SEMANTIC_CACHE_PREFIX = "mem:sem:"
+SEMANTIC_CACHE_SIZE = 64
+SEMANTIC_CACHE_TTL = 600
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+
+class EmbeddingCache:
+    """
+    In-process LRU cache for query embeddings with a TTL.
+
+    Keys are SHA-256 digests of the embedded text so that long queries do
+    not bloat the cache; each wrapped embedder adds its own namespace, so
+    instances with different models never share vectors. Mem0 calls the embedder from worker threads, so
+    access is guarded by a threading lock rather than an asyncio one.
+    """
+
+    def __init__(self, max_size: int = EMBED_CACHE_SIZE, ttl: float = EMBED_CACHE_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached embeddings
+            ttl: Seconds before an entry expires
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, memory_action: str | None = None, namespace: str = "") -> str:
+        """Build the cache key for a piece of text."""
+        return hashlib.sha256(
+            f"{namespace}\x00{memory_action or ''}\x00{text}".encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> list[float] | None:
+        """Return a cached embedding, or None on miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, vector = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return vector
+
+    def put(self, key: str, vector: list[float]) -> None:
+        """Store an embedding, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+
+    def wrap(self, embed, namespace: str = ""):
+        """
+        Wrap an embedder's ``embed`` method with this cache.
+
+        Args:
+            embed: Bound ``embed(text, memory_action=None)`` callable
+            namespace: Identifies the embedder's vector space (model and
+                dimensions); only calls with the same namespace share entries
+
+        Returns:
+            Callable with the same signature that consults the cache first
+        """
+
+        def cached_embed(text, memory_action=None):
+            args = (text,) if memory_action is None else (text, memory_action)
+            if not isinstance(text, str):
+                return embed(*args)
+            key = self.make_key(text, memory_action, namespace)
+            vector = self.get(key)
+            if vector is None:
+                vector = embed(*args)
+                self.put(key, vector)
+            return vector
+
+        return cached_embed
+
+
+_embedding_cache = EmbeddingCache()
+
+
+def _freeze(config: dict) -> tuple:
+    """Turn a flat config dict into a hashable cache key."""
+    return tuple(sorted(config.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_llm_config(llm_provider: str, llm_config: tuple) -> dict:
+    """Get provider-specific LLM config."""
+    llm_config = dict(llm_config)
+    if llm_provider == "ollama":
+        return {
+            "model": llm_config.get("model", "llama3.2"),
+            "ollama_base_url": llm_config.get(
+                "ollama_base_url", "http://ollama:11434"
+            ),
+            "temperature": llm_config.get("temperature", 0.1),
+        }
+    elif llm_provider == "groq":
+        return {
+            "model": llm_config.get("model", "llama-3.3-70b-versatile"),
+            "api_key": llm_config.get("api_key"),
+            "temperature": llm_config.get("temperature", 0.1),
+        }
+    elif llm_provider == "google":
+        return {
+            "model": llm_config.get("model", "gemini-2.0-flash-exp"),
+            "api_key": llm_config.get("api_key"),
+            "temperature": llm_config.get("temperature", 0.1),
+        }
+    else:
+        return llm_config
+
+
+@functools.lru_cache(maxsize=32)
+def _build_config(
+    qdrant_host: str,
+    qdrant_port: int,
+    qdrant_grpc_port: int,
+    collection_name: str,
+    embedding_model: str,
+    embedding_dims: int,
+    llm_provider: str,
+    llm_config: tuple,
+) -> dict:
+    """
+    Build Mem0 configuration.
+
+    Cached per argument tuple, so UserMemory instances with the same
+    settings also share one Qdrant client.
+    """
+    return {
+        "vector_store": {
+            "provider": "qdrant",
+            "config": {
+                "collection_name": collection_name,
+                "host": qdrant_host,
+                "port": qdrant_port,
+                "embedding_model_dims": embedding_dims,
+                # Mem0 does not expose prefer_grpc, so hand it a gRPC client
+                "client": QdrantClient(
+                    host=qdrant_host,
+                    port=qdrant_port,
+                    grpc_port=qdrant_grpc_port,
+                    prefer_grpc=True,
+                ),
+            },
+        },
+        "llm": {
+            "provider": llm_provider,
+            "config": _get_llm_config(llm_provider, llm_config),
+        },
+        # Use Ollama for embeddings too (avoids OpenAI dependency)
+        "embedder": {
+            "provider": "ollama",
+            "config": {
+                "model": embedding_model,
+                "ollama_base_url": dict(llm_config).get(
+                    "ollama_base_url", "http://ollama:11434"
+                ),
+            },
+        },
+    }
+
 
 class UserMemory:
     """
@@ -26,10 +271,14 @@ class UserMemory:
         self,
         qdrant_host: str = "localhost",
         qdrant_port: int = 6333,
-        collection_name: str = "user_memories",
+        qdrant_grpc_port: int = 6334,
+        collection_name: str = "user_memories_minilm",
         llm_provider: str = "ollama",
         llm_config: dict | None = None,
-        embedding_dims: int = 768,
+        embedding_model: str = "all-minilm",
+        embedding_dims: int = 384,
+        redis_host: str | None = None,
+        redis_port: int = 6379,
     ):
         """
         Initialize user memory.
@@ -37,91 +286,111 @@ class UserMemory:
         Args:
             qdrant_host: Qdrant server host
             qdrant_port: Qdrant server port
+            qdrant_grpc_port: Qdrant gRPC port (preferred over HTTP)
             collection_name: Collection name for memories
             llm_provider: LLM provider (ollama, groq, openai, etc.)
             llm_config: Provider-specific LLM config
-            embedding_dims: Embedding dimensions (768 for bge-base)
+            embedding_model: Ollama embedding model
+            embedding_dims: Embedding dimensions (384 for all-minilm)
+            redis_host: Redis host for the top-facts snapshot (disabled if None)
+            redis_port: Redis port
         """
         self.qdrant_host = qdrant_host
         self.qdrant_port = qdrant_port
+        self.qdrant_grpc_port = qdrant_grpc_port
         self.collection_name = collection_name
         self.llm_provider = llm_provider
         self.llm_config = llm_config or {}
+        self.embedding_model = embedding_model
         self.embedding_dims = embedding_dims
 
         self._memory: Memory | None = None
         self._initialized = False
+        self._redis = redis.Redis(host=redis_host, port=redis_port) if redis_host else None
+        self._pending_adds: dict[tuple[str, bytes], list[tuple[list, asyncio.Future]]] = {}
+        self._flush_timers: dict[tuple[str, bytes], asyncio.TimerHandle] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        self._ollama_sem = asyncio.Semaphore(MAX_CONCURRENCY)
 
     def _build_config(self) -> dict:
         """Build Mem0 configuration."""
-        config = {
-            "vector_store": {
-                "provider": "qdrant",
-                "config": {
-                    "collection_name": self.collection_name,
-                    "host": self.qdrant_host,
-                    "port": self.qdrant_port,
-                    "embedding_model_dims": self.embedding_dims,
-                },
-            },
-            "llm": {
-                "provider": self.llm_provider,
-                "config": self._get_llm_config(),
-            },
-            # Use Ollama for embeddings too (avoids OpenAI dependency)
-            "embedder": {
-                "provider": "ollama",
-                "config": {
-                    "model": "nomic-embed-text",
-                    "ollama_base_url": self.llm_config.get(
-                        "ollama_base_url", "http://ollama:11434"
-                    ),
-                },
-            },
-        }
-        return config
+        return _build_config(
+            self.qdrant_host,
+            self.qdrant_port,
+            self.qdrant_grpc_port,
+            self.collection_name,
+            self.embedding_model,
+            self.embedding_dims,
+            self.llm_provider,
+            _freeze(self.llm_config),
+        )
 
     def _get_llm_config(self) -> dict:
         """Get provider-specific LLM config."""
-        if self.llm_provider == "ollama":
-            return {
-                "model": self.llm_config.get("model", "llama3.2"),
-                "ollama_base_url": self.llm_config.get(
-                    "ollama_base_url", "http://ollama:11434"
-                ),
-                "temperature": self.llm_config.get("temperature", 0.1),
-            }
-        elif self.llm_provider == "groq":
-            return {
-                "model": self.llm_config.get("model", "llama-3.3-70b-versatile"),
-                "api_key": self.llm_config.get("api_key"),
-                "temperature": self.llm_config.get("temperature", 0.1),
-            }
-        elif self.llm_provider == "google":
-            return {
-                "model": self.llm_config.get("model", "gemini-2.0-flash-exp"),
-                "api_key": self.llm_config.get("api_key"),
-                "temperature": self.llm_config.get("temperature", 0.1),
-            }
-        else:
-            return self.llm_config
+        return dict(_get_llm_config(self.llm_provider, _freeze(self.llm_config)))
 
     def initialize(self):
         """Initialize the Mem0 memory system."""
         if self._initialized:
             return
 
-        logger.info(f"Initializing UserMemory with {self.llm_provider}...")
-        config = self._build_config()
+        logger.info("Initializing UserMemory with %s...", self.llm_provider)
+        # Mem0 may adjust the config in place, so hand it a copy of each section
+        config = {
+            section: {**values, "config": dict(values["config"])}
+            for section, values in self._build_config().items()
+        }
 
         try:
             self._memory = Memory.from_config(config)
+            if EMBED_CACHE_SIZE > 0:
+                embedder = self._memory.embedding_model
+                embedder.embed = _embedding_cache.wrap(
+                    embedder.embed, f"{self.embedding_model}:{self.embedding_dims}"
+                )
+            self._enable_quantization()
             self._initialized = True
             logger.info("UserMemory initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize UserMemory: {e}")
+            logger.error("Failed to initialize UserMemory: %s", e)
             raise
 
+    async def _run_ollama(self, func, *args, **kwargs):
+        """Run an Ollama-bound Mem0 call in a thread, bounded by MAX_CONCURRENCY."""
+        async with self._ollama_sem:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def warmup(self):
+        """
+        Initialize Mem0 and run a throwaway search.
+
+        Pays the cold start (client setup, Ollama model load, Qdrant
+        connection) at boot instead of on the first user request.
+        """
+        if not self._initialized:
+            await asyncio.to_thread(self.initialize)
+        try:
+            await self._run_ollama(
+                self._memory.search, query="_warmup", user_id="_warmup", limit=1
+            )
+            logger.info("UserMemory warmed up")
+        except Exception as e:
+            logger.warning("UserMemory warmup search failed: %s", e)
+
+    def _enable_quantization(self):
+        """Enable int8 scalar quantization on the memories collection."""
+        try:
+            client = self._memory.vector_store.client
+            info = client.get_collection(self.collection_name)
+            if info.config.quantization_config is None:
+                client.update_collection(
+                    collection_name=self.collection_name,
+                    quantization_config=QUANTIZATION_CONFIG,
+                )
+                logger.info("Enabled int8 quantization on %s", self.collection_name)
+        except Exception as e:
+            logger.warning("Could not enable quantization on %s: %s", self.collection_name, e)
+
     async def add_memory(
         self,
         user_id: str,
@@ -142,27 +411,102 @@ class UserMemory:
         Returns:
             List of extracted memories
         """
-        if not self._initialized:
-            self.initialize()
-
         try:
-            result = self._memory.add(
-                messages=messages,
-                user_id=user_id,
-                metadata=metadata or {},
-            )
-            logger.debug(f"Added memories for user {user_id}: {result}")
+            if not self._initialized:
+                self.initialize()
+
+            with memory_span(
+                "mem0.add", f"user={user_id}", user_id=user_id, messages=len(messages)
+            ):
+                result = await self._run_ollama(
+                    self._memory.add,
+                    messages=messages,
+                    user_id=user_id,
+                    metadata=metadata or {},
+                )
+            logger.debug("Added memories for user %s: %s", user_id, result)
+            await self._refresh_snapshot(user_id)
             return result.get("results", []) if isinstance(result, dict) else []
         except Exception as e:
-            logger.error(f"Error adding memory for user {user_id}: {e}")
+            logger.error("Error adding memory for user %s: %s", user_id, e)
             return []
 
+    async def enqueue_memory(
+        self,
+        user_id: str,
+        messages: list[dict[str, str]],
+        metadata: dict[str, Any] | None = None,
+    ) -> list[dict]:
+        """
+        Add memories, coalescing with other calls made shortly after.
+
+        Calls for the same user and metadata within ADD_BATCH_DELAY seconds
+        (or until ADD_BATCH_SIZE calls queue up) share one Mem0 add, so the
+        LLM extraction pass runs once for the whole batch.
+
+        Args:
+            user_id: User identifier
+            messages: Messages to extract memories from
+            metadata: Optional metadata to attach
+
+        Returns:
+            Memories extracted from the whole batch
+        """
+        key = (user_id, orjson.dumps(metadata or {}, option=orjson.OPT_SORT_KEYS))
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending_adds.setdefault(key, [])
+        batch.append((messages, future))
+        if len(batch) >= ADD_BATCH_SIZE:
+            self._flush_pending(key)
+        elif len(batch) == 1:
+            self._flush_timers[key] = loop.call_later(
+                ADD_BATCH_DELAY, self._flush_pending, key
+            )
+
+        return await future
+
+    def _flush_pending(self, key: tuple[str, bytes]):
+        """Start a Mem0 add for a queued batch."""
+        # A batch flushed because it filled up must not leave its timer
+        # behind to cut the next batch for this key short
+        timer = self._flush_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending_adds.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.create_task(self._add_batch(key, batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _add_batch(self, key: tuple[str, bytes], batch: list[tuple[list, asyncio.Future]]):
+        """Run one Mem0 add for a batch and resolve every waiter."""
+        try:
+            user_id, metadata = key
+            messages = [message for msgs, _ in batch for message in msgs]
+            result = await self.add_memory(user_id, messages, orjson.loads(metadata))
+        except BaseException as e:
+            # Nothing awaits this task, so the waiters are the only place
+            # the error can surface; left pending they would hang forever
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for _, future in batch:
+            if not future.done():
+                future.set_result(result)
+
     async def search_memories(
         self,
         user_id: str,
         query: str,
         limit: int = 5,
-    ) -> list[dict]:
+        filters: dict[str, Any] | None = None,
+    ) -> list[tuple[str, float]]:
         """
         Search for relevant memories.
 
@@ -170,25 +514,210 @@ class UserMemory:
             user_id: User identifier
             query: Search query
             limit: Maximum results
+            filters: Payload filters pushed down to Qdrant (e.g. session_id, source)
 
         Returns:
-            List of relevant memories with scores
+            List of (memory text, relevance score) tuples
         """
         if not self._initialized:
             self.initialize()
 
         try:
-            results = self._memory.search(
-                query=query,
-                user_id=user_id,
-                limit=limit,
+            results = None
+            if limit > RERANK_MIN_LIMIT:
+                with memory_span(
+                    "qdrant.rerank", f"user={user_id}",
+                    user_id=user_id, limit=limit, query_len=len(query),
+                ):
+                    results = await self._run_ollama(
+                        self._search_reranked, user_id, query, limit, filters
+                    )
+            if results is None:
+                with memory_span(
+                    "mem0.search", f"user={user_id}",
+                    user_id=user_id, limit=limit, query_len=len(query),
+                ):
+                    results = await self._run_ollama(
+                        self._memory.search,
+                        query=query,
+                        user_id=user_id,
+                        limit=limit,
+                        filters=filters,
+                    )
+            memories = self._normalize_results(results)
+            logger.debug("Found %d memories for query: %.50s", len(memories), query)
+            return memories
+        except Exception as e:
+            logger.error("Error searching memories for user %s: %s", user_id, e)
+            return []
+
+    @staticmethod
+    def _normalize_results(results: Any) -> list[tuple[str, float]]:
+        """
+        Normalize Mem0 search output to (text, score) tuples.
+
+        Mem0 returns either a list or a {"results": [...]} dict, with items
+        that are plain strings or dicts keyed by "memory" or "text".
+        """
+        if isinstance(results, dict):
+            results = results.get("results", [])
+
+        memories = []
+        for mem in results or []:
+            if isinstance(mem, str):
+                memories.append((mem, 0.0))
+                continue
+            text = mem.get("memory") or mem.get("text")
+            if text:
+                memories.append((text, float(mem.get("score") or 0.0)))
+        return memories
+
+    @staticmethod
+    def _rerank_numpy(
+        query_vec: np.ndarray, cand_vecs: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rank candidate vectors by cosine similarity to the query.
+
+        Args:
+            query_vec: Query embedding, shape (d,)
+            cand_vecs: Candidate embeddings, shape (n, d)
+            k: Number of results to keep
+
+        Returns:
+            Tuple of (indices, scores) for the top-k candidates, best first
+        """
+        q = np.asarray(query_vec, dtype=np.float32)
+        c = np.asarray(cand_vecs, dtype=np.float32)
+        q = q / (np.linalg.norm(q) or 1.0)
+        norms = np.linalg.norm(c, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        scores = (c / norms) @ q
+
+        k = min(k, len(scores))
+        idx = np.argpartition(-scores, k)[:k] if k < len(scores) else np.arange(len(scores))
+        idx = idx[np.argsort(-scores[idx])]
+        return idx, scores[idx]
+
+    def _search_reranked(
+        self,
+        user_id: str,
+        query: str,
+        limit: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict] | None:
+        """
+        Search a user's memories by scoring their stored vectors locally.
+
+        Pulls the user's vectors straight from Qdrant and ranks them with a
+        single matrix-vector product. Only users with at most
+        RERANK_MAX_CANDIDATES memories are ranked here; for larger sets the
+        first page would not hold the true top-k, so Mem0's vector search is
+        used instead.
+
+        Returns:
+            Mem0-style result dicts, or None to fall back to Mem0's search
+        """
+        try:
+            query_vec = self._memory.embedding_model.embed(query, "search")
+            vector_store = self._memory.vector_store
+            conditions = {"user_id": user_id, **(filters or {})}
+            points, next_offset = vector_store.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(key=key, match=models.MatchValue(value=value))
+                        for key, value in conditions.items()
+                    ]
+                ),
+                limit=RERANK_MAX_CANDIDATES,
+                with_payload=True,
+                with_vectors=True,
             )
-            logger.debug(f"Found {len(results)} memories for query: {query[:50]}...")
-            return results
         except Exception as e:
-            logger.error(f"Error searching memories for user {user_id}: {e}")
+            logger.debug("Local rerank unavailable, using Mem0 search: %s", e)
+            return None
+
+        if next_offset is not None:
+            logger.debug(
+                "User %s has more than %d memories, using Mem0 search",
+                user_id, RERANK_MAX_CANDIDATES,
+            )
+            return None
+        if not points:
             return []
 
+        idx, scores = self._rerank_numpy(
+            query_vec, np.array([p.vector for p in points], dtype=np.float32), limit
+        )
+        results = []
+        for i, score in zip(idx, scores, strict=True):
+            payload = points[i].payload or {}
+            results.append(
+                {
+                    "id": str(points[i].id),
+                    "memory": payload.get("data", ""),
+                    "score": float(score),
+                    "created_at": payload.get("created_at"),
+                    "updated_at": payload.get("updated_at"),
+                    "user_id": payload.get("user_id"),
+                }
+            )
+        return results
+
+    async def reindex_from(self, source_collection: str, batch_size: int = 256) -> int:
+        """
+        Re-embed memories from another collection into this one.
+
+        Used once when switching embedding models, so vectors of different
+        dimensions never share a collection.
+
+        Args:
+            source_collection: Collection holding the old embeddings
+            batch_size: Points fetched and re-embedded per batch
+
+        Returns:
+            Number of memories copied
+        """
+        if not self._initialized:
+            self.initialize()
+
+        vector_store = self._memory.vector_store
+        embedder = self._memory.embedding_model
+        copied = 0
+        offset = None
+
+        while True:
+            points, offset = await asyncio.to_thread(
+                vector_store.client.scroll,
+                collection_name=source_collection,
+                limit=batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=False,
+            )
+            points = [p for p in points if (p.payload or {}).get("data")]
+            if points:
+                vectors = [
+                    await self._run_ollama(embedder.embed, p.payload["data"], "add")
+                    for p in points
+                ]
+                await asyncio.to_thread(
+                    vector_store.insert,
+                    vectors=vectors,
+                    payloads=[p.payload for p in points],
+                    ids=[str(p.id) for p in points],
+                )
+                copied += len(points)
+            if offset is None:
+                break
+
+        logger.info(
+            "Reindexed %d memories from %s into %s",
+            copied, source_collection, self.collection_name,
+        )
+        return copied
+
     async def get_all_memories(self, user_id: str) -> list[dict]:
         """
         Get all memories for a user.
@@ -203,12 +732,13 @@ class UserMemory:
             self.initialize()
 
         try:
-            result = self._memory.get_all(user_id=user_id)
+            with memory_span("mem0.get_all", f"user={user_id}", user_id=user_id):
+                result = await asyncio.to_thread(self._memory.get_all, user_id=user_id)
             memories = result.get("results", []) if isinstance(result, dict) else result
-            logger.debug(f"Retrieved {len(memories)} memories for user {user_id}")
+            logger.debug("Retrieved %d memories for user %s", len(memories), user_id)
             return memories
         except Exception as e:
-            logger.error(f"Error getting memories for user {user_id}: {e}")
+            logger.error("Error getting memories for user %s: %s", user_id, e)
             return []
 
     async def get_memory(self, memory_id: str) -> dict | None:
@@ -225,9 +755,10 @@ class UserMemory:
             self.initialize()
 
         try:
-            return self._memory.get(memory_id=memory_id)
+            with memory_span("mem0.get", f"memory={memory_id}"):
+                return await asyncio.to_thread(self._memory.get, memory_id=memory_id)
         except Exception as e:
-            logger.error(f"Error getting memory {memory_id}: {e}")
+            logger.error("Error getting memory %s: %s", memory_id, e)
             return None
 
     async def update_memory(
@@ -249,17 +780,21 @@ class UserMemory:
             self.initialize()
 
         try:
-            return self._memory.update(memory_id=memory_id, data=data)
+            with memory_span("mem0.update", f"memory={memory_id}"):
+                return await self._run_ollama(
+                    self._memory.update, memory_id=memory_id, data=data
+                )
         except Exception as e:
-            logger.error(f"Error updating memory {memory_id}: {e}")
+            logger.error("Error updating memory %s: %s", memory_id, e)
             return None
 
-    async def delete_memory(self, memory_id: str) -> bool:
+    async def delete_memory(self, memory_id: str, user_id: str | None = None) -> bool:
         """
         Delete a specific memory.
 
         Args:
             memory_id: Memory identifier
+            user_id: Owner of the memory, used to refresh their snapshot
 
         Returns:
             True if deleted
@@ -268,10 +803,13 @@ class UserMemory:
             self.initialize()
 
         try:
-            self._memory.delete(memory_id=memory_id)
+            with memory_span("mem0.delete", f"memory={memory_id}", user_id=user_id):
+                await asyncio.to_thread(self._memory.delete, memory_id=memory_id)
+            if user_id:
+                await self._refresh_snapshot(user_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting memory {memory_id}: {e}")
+            logger.error("Error deleting memory %s: %s", memory_id, e)
             return False
 
     async def delete_all_memories(self, user_id: str) -> bool:
@@ -288,11 +826,13 @@ class UserMemory:
             self.initialize()
 
         try:
-            self._memory.delete_all(user_id=user_id)
-            logger.info(f"Deleted all memories for user {user_id}")
+            with memory_span("mem0.delete_all", f"user={user_id}", user_id=user_id):
+                await asyncio.to_thread(self._memory.delete_all, user_id=user_id)
+            logger.info("Deleted all memories for user %s", user_id)
+            await self._drop_snapshot(user_id)
             return True
         except Exception as e:
-            logger.error(f"Error deleting memories for user {user_id}: {e}")
+            logger.error("Error deleting memories for user %s: %s", user_id, e)
             return False
 
     async def get_user_context(self, user_id: str, query: str) -> str:
@@ -300,30 +840,147 @@ class UserMemory:
         Get formatted user context for a query.
 
         Combines relevant memories into a context string for the agent.
+        Without a query, the user's most recent facts are used instead.
 
         Args:
             user_id: User identifier
-            query: Current user query
+            query: Current user query (may be empty)
 
         Returns:
             Formatted context string
         """
-        memories = await self.search_memories(user_id, query, limit=5)
+        memories = None
+        if not query.strip():
+            memories = await self._get_snapshot(user_id)
+
+        query_vec = None
+        if memories is None:
+            query_vec = await self._embed_query(query)
+            if query_vec is not None:
+                cached = await self._semantic_lookup(user_id, query_vec)
+                if cached is not None:
+                    return cached
+            memories = await self.search_memories(user_id, query, limit=5)
+
+        context = ""
+        if memories:
+            buf = io.StringIO()
+            buf.write("## User Context (from memory)")
+            for text, _ in memories:
+                buf.write(f"\n- {text}")
+            context = buf.getvalue()
+
+        # An empty result may be a search that failed (search_memories logs
+        # and returns []); caching it would hide memory for the whole TTL
+        if query_vec is not None and context:
+            await self._semantic_store(user_id, query_vec, context)
+        return context
+
+    async def _embed_query(self, query: str) -> np.ndarray | None:
+        """
+        Embed a query as an int8-quantized unit vector for the semantic cache.
 
-        if not memories:
-            return ""
+        Goes through the wrapped embedder, so a later Mem0 search for the
+        same query hits the embedding cache instead of Ollama.
+        """
+        if self._redis is None:
+            return None
+        if not self._initialized:
+            self.initialize()
+        try:
+            with memory_span("mem0.embed", "semantic cache query", query_len=len(query)):
+                vec = await self._run_ollama(
+                    self._memory.embedding_model.embed, query, "search"
+                )
+        except Exception as e:
+            logger.debug("Semantic cache embedding failed: %s", e)
+            return None
+        vec = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if not norm:
+            return None
+        return np.round(vec / norm * 127).astype(np.int8)
 
-        context_parts = ["## User Context (from memory)"]
-        for mem in memories:
-            # Handle both string and dict return types from Mem0
-            if isinstance(mem, str):
-                memory_text = mem
-            else:
-                memory_text = mem.get("memory", mem.get("text", str(mem)))
-            if memory_text:
-                context_parts.append(f"- {memory_text}")
+    async def _semantic_lookup(self, user_id: str, query_vec: np.ndarray) -> str | None:
+        """Return a cached context for a near-duplicate query, if any."""
+        try:
+            with memory_span("redis.semantic_cache", f"user={user_id}", user_id=user_id):
+                entries = await self._redis.lrange(
+                    f"{SEMANTIC_CACHE_PREFIX}{user_id}", 0, SEMANTIC_CACHE_SIZE - 1
+                )
+        except Exception as e:
+            logger.debug("Semantic cache read failed for user %s: %s", user_id, e)
+            return None
+
+        dims = len(query_vec)
+        entries = [entry for entry in entries if len(entry) >= dims]
+        if not entries:
+            return None
+
+        cached_vecs = np.frombuffer(
+            b"".join(entry[:dims] for entry in entries), dtype=np.int8
+        ).reshape(len(entries), dims)
+        scores = cached_vecs.astype(np.float32) @ query_vec.astype(np.float32) / (127 * 127)
+        best = int(np.argmax(scores))
+        if scores[best] < SEMANTIC_CACHE_THRESHOLD:
+            return None
+        return entries[best][dims:].decode()
+
+    async def _semantic_store(self, user_id: str, query_vec: np.ndarray, context: str):
+        """Remember the context built for a query."""
+        key = f"{SEMANTIC_CACHE_PREFIX}{user_id}"
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.lpush(key, query_vec.tobytes() + context.encode())
+                pipe.ltrim(key, 0, SEMANTIC_CACHE_SIZE - 1)
+                pipe.expire(key, SEMANTIC_CACHE_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug("Semantic cache write failed for user %s: %s", user_id, e)
 
-        return "\n".join(context_parts)
+    async def _get_snapshot(self, user_id: str) -> list[tuple[str, float]] | None:
+        """Return the cached top facts for a user, or None on miss."""
+        if self._redis is None:
+            return None
+        try:
+            with memory_span("redis.snapshot", f"user={user_id}", user_id=user_id):
+                data = await self._redis.get(f"{SNAPSHOT_PREFIX}{user_id}")
+        except Exception as e:
+            logger.debug("Memory snapshot read failed for user %s: %s", user_id, e)
+            return None
+        if not data:
+            return None
+        return [(fact, 0.0) for fact in orjson.loads(data)]
+
+    async def _refresh_snapshot(self, user_id: str):
+        """Rebuild the top-facts snapshot and drop cached contexts after a change."""
+        if self._redis is None:
+            return
+        memories = await self.get_all_memories(user_id)
+        memories = sorted(
+            (mem for mem in memories if isinstance(mem, dict)),
+            key=lambda mem: mem.get("updated_at") or mem.get("created_at") or "",
+            reverse=True,
+        )
+        facts = [mem["memory"] for mem in memories[:SNAPSHOT_SIZE] if mem.get("memory")]
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(f"{SNAPSHOT_PREFIX}{user_id}", orjson.dumps(facts), ex=SNAPSHOT_TTL)
+                pipe.delete(f"{SEMANTIC_CACHE_PREFIX}{user_id}")
+                await pipe.execute()
+        except Exception as e:
+            logger.debug("Memory snapshot write failed for user %s: %s", user_id, e)
+
+    async def _drop_snapshot(self, user_id: str):
+        """Remove a user's top-facts snapshot and cached contexts."""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(
+                f"{SNAPSHOT_PREFIX}{user_id}", f"{SEMANTIC_CACHE_PREFIX}{user_id}"
+            )
+        except Exception as e:
+            logger.debug("Memory snapshot delete failed for user %s: %s", user_id, e)
 
     def health_check(self) -> bool:
         """Check if memory system is healthy."""
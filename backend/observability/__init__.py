@@ -7,11 +7,11 @@ Provides:
 """
 
 from observability.langfuse_tracer import (
+    LANGCHAIN_CALLBACK_AVAILABLE,
     LangfuseTracer,
     get_langfuse_handler,
     get_tracer,
     observe,
-    LANGCHAIN_CALLBACK_AVAILABLE,
 )
 from observability.sentry_integration import (
     init_sentry,
@@ -21,6 +21,7 @@ from observability.sentry_integration import (
     span,
 )
 
+
 __all__ = [
     # Langfuse
     "LangfuseTracer",
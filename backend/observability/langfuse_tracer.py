@@ -9,23 +9,181 @@ Provides comprehensive tracing for:
 Uses Langfuse v3 API with OpenTelemetry-based tracing.
 """
 
+import atexit
+import importlib.util
+import inspect
 import logging
 import os
-from contextlib import contextmanager
-from typing import Any, Generator
+import threading
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any
 
+import httpx
 from langfuse import Langfuse, observe
 
 logger = logging.getLogger(__name__)
 
-# Try to import LangChain callback handler (optional - requires langfuse[langchain])
-try:
-    from langfuse.callback import CallbackHandler
-    LANGCHAIN_CALLBACK_AVAILABLE = True
-except ImportError:
-    CallbackHandler = None
-    LANGCHAIN_CALLBACK_AVAILABLE = False
-    logger.debug("LangChain callback handler not available (install langfuse[langchain])")
+# Shared HTTP transport for the Langfuse client and callback handlers
+HTTPX_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTPX_TIMEOUT = 10.0
+
+# Explicit flushes block on HTTP; the SDK already batches in a background thread
+ENFORCE_FLUSH = os.getenv("F1_LANGFUSE_ENFORCE_FLUSH", "false").lower() in ("1", "true", "yes")
+
+# Backpressure: new observations are dropped while too many spans are open or
+# after repeated SDK failures, so request latency never waits on Langfuse
+MAX_INFLIGHT = int(os.getenv("LANGFUSE_MAX_INFLIGHT", "10000"))
+BREAKER_THRESHOLD = int(os.getenv("LANGFUSE_BREAKER_THRESHOLD", "5"))
+BREAKER_COOLDOWN = float(os.getenv("LANGFUSE_BREAKER_COOLDOWN", "30"))
+
+# Repeated per-call failures are logged at 1, 2, 4, ... occurrences (then every
+# ERROR_LOG_CAP) within a rolling window, as warnings so Sentry's logging
+# integration does not turn a Langfuse outage into an event storm
+ERROR_LOG_WINDOW = 60.0
+ERROR_LOG_CAP = 1024
+
+# Tags applied when a caller gives none; the SDK only reads them
+_DEFAULT_TAGS = ("f1-ria",)
+
+# IDs of the innermost span() opened in this context, so lookups skip the
+# OpenTelemetry context walk
+_current_trace_id: ContextVar[str | None] = ContextVar("lf_trace_id", default=None)
+_current_observation_id: ContextVar[str | None] = ContextVar("lf_observation_id", default=None)
+
+# LangChain callback handler (optional - requires langfuse[langchain]), imported
+# on first use so LangChain is not loaded when tracing is disabled
+_callback_cls: type | None = None
+_callback_loaded = False
+_callback_param_names: frozenset[str] | None = None
+
+
+def _get_callback_cls() -> type | None:
+    """Import and cache the LangChain CallbackHandler class, or None."""
+    global _callback_cls, _callback_loaded
+    if not _callback_loaded:
+        try:
+            from langfuse.callback import CallbackHandler
+            _callback_cls = CallbackHandler
+        except ImportError:
+            logger.debug("LangChain callback handler not available (install langfuse[langchain])")
+        _callback_loaded = True
+    return _callback_cls
+
+
+def _callback_params() -> frozenset[str]:
+    """Constructor parameter names of the installed CallbackHandler."""
+    global _callback_param_names
+    if _callback_param_names is None:
+        try:
+            _callback_param_names = frozenset(
+                inspect.signature(_get_callback_cls().__init__).parameters
+            )
+        except (AttributeError, TypeError, ValueError):
+            _callback_param_names = frozenset()
+    return _callback_param_names
+
+
+def _module_available(name: str) -> bool:
+    """Whether a module can be found, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# Whether the callback handler and LangChain are installed (checked without
+# importing them; get_callback_handler() still handles a failing import)
+LANGCHAIN_CALLBACK_AVAILABLE = _module_available("langfuse.callback") and _module_available(
+    "langchain"
+)
+
+
+class _ErrorSampler:
+    """Rate-limits warnings for repeated failures of the same operation."""
+
+    def __init__(self, window: float = ERROR_LOG_WINDOW, cap: int = ERROR_LOG_CAP):
+        self._window = window
+        self._cap = cap
+        # operation -> [failures, next failure count to log, window start]
+        self._state: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def error(self, operation: str, exc: BaseException) -> None:
+        """Record a failure and log it if it falls on the backoff schedule."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._state.get(operation)
+            if state is None or now - state[2] > self._window:
+                state = self._state[operation] = [0, 1, now]
+            state[0] += 1
+            count = state[0]
+            if count < state[1]:
+                return
+            state[1] = count + min(count, self._cap)
+
+        if count == 1:
+            logger.warning(f"Langfuse {operation} failed: {exc}")
+        else:
+            logger.warning(
+                f"Langfuse {operation} failed: {exc} "
+                f"({count} failures in the last {self._window:.0f}s)"
+            )
+
+
+_errors = _ErrorSampler()
+
+_NULL_CM = nullcontext(None)
+
+
+class _SpanScope:
+    """
+    Delegates to an SDK observation context manager.
+
+    Counts the observation as in flight while it is open (see MAX_INFLIGHT)
+    and tracks the current IDs.
+    """
+
+    __slots__ = ("_tracer", "_ctx", "_operation", "_tokens")
+
+    def __init__(self, tracer: "LangfuseTracer", ctx: Any, operation: str = "span"):
+        self._tracer = tracer
+        self._ctx = ctx
+        self._operation = operation
+        self._tokens = None
+
+    def __enter__(self) -> Any:
+        try:
+            observation = self._ctx.__enter__()
+        except Exception as e:
+            self._tracer._record_failure()
+            _errors.error(self._operation, e)
+            self._ctx = None
+            return None
+
+        self._tracer._record_success()
+        self._tracer._inflight += 1
+        self._tokens = (
+            _current_trace_id.set(getattr(observation, "trace_id", None)),
+            _current_observation_id.set(getattr(observation, "id", None)),
+        )
+        return observation
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._ctx is None:
+            return False
+        trace_token, observation_token = self._tokens
+        _current_observation_id.reset(observation_token)
+        _current_trace_id.reset(trace_token)
+        self._tracer._inflight -= 1
+        try:
+            # Pass the exception through so the SDK marks the span as errored;
+            # never let the SDK suppress it
+            self._ctx.__exit__(exc_type, exc, tb)
+        except Exception:
+            pass
+        return False
 
 
 class LangfuseTracer:
@@ -45,6 +203,9 @@ class LangfuseTracer:
         secret_key: str | None = None,
         host: str | None = None,
         enabled: bool = True,
+        sample_rate: float | None = None,
+        flush_at: int | None = None,
+        flush_interval: float | None = None,
     ):
         """
         Initialize Langfuse tracer.
@@ -54,14 +215,42 @@ class LangfuseTracer:
             secret_key: Langfuse secret key (or LANGFUSE_SECRET_KEY env var)
             host: Langfuse host URL (or LANGFUSE_HOST env var)
             enabled: Whether tracing is enabled
+            sample_rate: Fraction of traces to record
+                (or LANGFUSE_TRACES_SAMPLE_RATE env var, default 1.0). The SDK
+                decides per trace ID, so a trace is kept or dropped whole.
+            flush_at: Events per export batch (or LANGFUSE_FLUSH_AT, default 50).
+                Use ~100 in production, 1 for local debugging.
+            flush_interval: Seconds between background exports
+                (or LANGFUSE_FLUSH_INTERVAL, default 1.0). Use ~5 in production.
         """
         self.enabled = enabled
         self.public_key = public_key or os.getenv("LANGFUSE_PUBLIC_KEY")
         self.secret_key = secret_key or os.getenv("LANGFUSE_SECRET_KEY")
         self.host = host or os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com")
 
+        if sample_rate is None:
+            sample_rate = float(os.getenv("LANGFUSE_TRACES_SAMPLE_RATE", "1.0"))
+        self._sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.flush_at = flush_at if flush_at is not None else int(
+            os.getenv("LANGFUSE_FLUSH_AT", "50")
+        )
+        self.flush_interval = flush_interval if flush_interval is not None else float(
+            os.getenv("LANGFUSE_FLUSH_INTERVAL", "1.0")
+        )
+
+        # Backpressure state (see _admit)
+        self.dropped_total = 0
+        self._inflight = 0
+        self._failures = 0
+        self._breaker_until = 0.0
+
         self._client: Langfuse | None = None
+        self._httpx: httpx.Client | None = None
         self._initialized = False
+        # Single flag for the per-call fast path; set by initialize()/shutdown()
+        self._active = False
+        self._atexit_registered = False
+        self._shutdown_done = False
 
     def initialize(self) -> bool:
         """
@@ -83,15 +272,25 @@ class LangfuseTracer:
             return False
 
         try:
+            self._httpx = httpx.Client(limits=HTTPX_LIMITS, timeout=HTTPX_TIMEOUT)
             self._client = Langfuse(
                 public_key=self.public_key,
                 secret_key=self.secret_key,
                 host=self.host,
+                httpx_client=self._httpx,
+                flush_at=self.flush_at,
+                flush_interval=self.flush_interval,
+                sample_rate=self._sample_rate,
             )
 
             # Verify authentication
             if self._client.auth_check():
                 self._initialized = True
+                self._active = True
+                if not self._atexit_registered:
+                    # Flush buffered events once on normal interpreter exit
+                    atexit.register(self.shutdown)
+                    self._atexit_registered = True
                 logger.info(f"Langfuse initialized successfully (host: {self.host})")
                 return True
             else:
@@ -125,29 +324,67 @@ class LangfuseTracer:
         Returns:
             CallbackHandler or None if tracing disabled or unavailable
         """
-        if not self.enabled or not self._initialized:
+        if not self._active:
             return None
 
-        if not LANGCHAIN_CALLBACK_AVAILABLE:
+        callback_cls = _get_callback_cls()
+        if callback_cls is None:
             logger.debug("LangChain callback handler not available")
             return None
 
         try:
-            handler = CallbackHandler(
+            handler = callback_cls(
                 public_key=self.public_key,
                 secret_key=self.secret_key,
                 host=self.host,
                 session_id=session_id,
                 user_id=user_id,
                 trace_name=trace_name,
-                metadata=metadata or {},
-                tags=tags or ["f1-ria"],
+                metadata=metadata,
+                tags=tags or list(_DEFAULT_TAGS),
+                **self._shared_transport_kwargs(),
             )
             return handler
         except Exception as e:
-            logger.error(f"Failed to create callback handler: {e}")
+            _errors.error("callback_handler", e)
             return None
 
+    def _admit(self) -> bool:
+        """Whether a new observation may be created right now.
+
+        Rejected observations are counted in ``dropped_total``.
+        """
+        if self._inflight >= MAX_INFLIGHT or (
+            self._breaker_until and time.monotonic() < self._breaker_until
+        ):
+            self.dropped_total += 1
+            return False
+        return True
+
+    def _record_success(self) -> None:
+        """Close the breaker after a successful SDK call."""
+        self._failures = 0
+        self._breaker_until = 0.0
+
+    def _record_failure(self) -> None:
+        """Count an SDK failure and open the breaker after repeated ones."""
+        self._failures += 1
+        if self._failures >= BREAKER_THRESHOLD:
+            self._breaker_until = time.monotonic() + BREAKER_COOLDOWN
+            self._failures = 0
+            logger.warning(
+                f"Langfuse failing repeatedly; pausing tracing for {BREAKER_COOLDOWN:.0f}s"
+            )
+
+    def _shared_transport_kwargs(self) -> dict:
+        """Handler kwargs that reuse this tracer's client or HTTP pool."""
+        params = _callback_params()
+        if "langfuse_client" in params and self._client:
+            return {"langfuse_client": self._client}
+        if "httpx_client" in params and self._httpx:
+            return {"httpx_client": self._httpx}
+        return {}
+
     def start_trace(
         self,
         name: str,
@@ -169,9 +406,9 @@ class LangfuseTracer:
             tags: Tags for filtering
 
         Returns:
-            Trace context or None
+            Trace context manager or None
         """
-        if not self.enabled or not self._client:
+        if not self._active or not self._admit():
             return None
 
         try:
@@ -181,13 +418,14 @@ class LangfuseTracer:
                 session_id=session_id,
                 user_id=user_id,
                 input=input_data,
-                metadata=metadata or {},
-                tags=tags or ["f1-ria"],
+                metadata=metadata,
+                tags=tags or _DEFAULT_TAGS,
             )
-            return trace
         except Exception as e:
-            logger.error(f"Failed to start trace: {e}")
+            self._record_failure()
+            _errors.error("start_trace", e)
             return None
+        return _SpanScope(self, trace, "start_trace")
 
     def start_span(
         self,
@@ -204,21 +442,22 @@ class LangfuseTracer:
             metadata: Additional metadata
 
         Returns:
-            Span context or None
+            Span context manager or None
         """
-        if not self.enabled or not self._client:
+        if not self._active or not self._admit():
             return None
 
         try:
             span = self._client.start_as_current_span(
                 name=name,
                 input=input_data,
-                metadata=metadata or {},
+                metadata=metadata,
             )
-            return span
         except Exception as e:
-            logger.error(f"Failed to start span: {e}")
+            self._record_failure()
+            _errors.error("start_span", e)
             return None
+        return _SpanScope(self, span, "start_span")
 
     def start_generation(
         self,
@@ -237,9 +476,9 @@ class LangfuseTracer:
             metadata: Additional metadata
 
         Returns:
-            Generation context or None
+            Generation context manager or None
         """
-        if not self.enabled or not self._client:
+        if not self._active or not self._admit():
             return None
 
         try:
@@ -247,20 +486,20 @@ class LangfuseTracer:
                 name=name,
                 model=model,
                 input=input_data,
-                metadata=metadata or {},
+                metadata=metadata,
             )
-            return gen
         except Exception as e:
-            logger.error(f"Failed to start generation: {e}")
+            self._record_failure()
+            _errors.error("start_generation", e)
             return None
+        return _SpanScope(self, gen, "start_generation")
 
-    @contextmanager
     def span(
         self,
         name: str,
         input_data: Any = None,
         metadata: dict | None = None,
-    ) -> Generator[Any, None, None]:
+    ) -> Any:
         """
         Context manager for creating spans.
 
@@ -269,30 +508,24 @@ class LangfuseTracer:
             input_data: Input data for the span
             metadata: Additional metadata
 
-        Yields:
-            Span object
+        Returns:
+            Context manager yielding the span object, or None when
+            disabled
         """
-        if not self.enabled or not self._client:
-            yield None
-            return
+        if not self._active or not self._admit():
+            return _NULL_CM
 
-        span_ctx = None
         try:
             span_ctx = self._client.start_as_current_span(
                 name=name,
                 input=input_data,
-                metadata=metadata or {},
+                metadata=metadata,
             )
-            yield span_ctx
         except Exception as e:
-            logger.error(f"Span error: {e}")
-            yield None
-        finally:
-            if span_ctx:
-                try:
-                    span_ctx.__exit__(None, None, None)
-                except Exception:
-                    pass
+            self._record_failure()
+            _errors.error("span", e)
+            return _NULL_CM
+        return _SpanScope(self, span_ctx)
 
     def score_current_trace(
         self,
@@ -308,7 +541,7 @@ class LangfuseTracer:
             value: Score value (0-1)
             comment: Optional comment
         """
-        if not self.enabled or not self._client:
+        if not self._active:
             return
 
         try:
@@ -318,7 +551,7 @@ class LangfuseTracer:
                 comment=comment,
             )
         except Exception as e:
-            logger.error(f"Failed to score trace: {e}")
+            _errors.error("score_trace", e)
 
     def create_score(
         self,
@@ -336,7 +569,7 @@ class LangfuseTracer:
             value: Score value (0-1)
             comment: Optional comment
         """
-        if not self.enabled or not self._client:
+        if not self._active:
             return
 
         try:
@@ -347,46 +580,71 @@ class LangfuseTracer:
                 comment=comment,
             )
         except Exception as e:
-            logger.error(f"Failed to create score: {e}")
+            _errors.error("create_score", e)
 
     def get_current_trace_id(self) -> str | None:
-        """Get the current trace ID."""
-        if not self.enabled or not self._client:
+        """Get the current trace ID (cached for spans opened via span())."""
+        if not self._active:
             return None
+        trace_id = _current_trace_id.get()
+        if trace_id:
+            return trace_id
         try:
             return self._client.get_current_trace_id()
         except Exception:
             return None
 
     def get_current_observation_id(self) -> str | None:
-        """Get the current observation/span ID."""
-        if not self.enabled or not self._client:
+        """Get the current observation/span ID (cached for spans opened via span())."""
+        if not self._active:
             return None
+        observation_id = _current_observation_id.get()
+        if observation_id:
+            return observation_id
         try:
             return self._client.get_current_observation_id()
         except Exception:
             return None
 
     def flush(self):
-        """Flush pending events to Langfuse."""
+        """
+        Flush pending events to Langfuse.
+
+        A no-op unless F1_LANGFUSE_ENFORCE_FLUSH is set: the SDK exports in
+        batches from a background thread, and shutdown() flushes on exit.
+        """
+        if not ENFORCE_FLUSH or self._shutdown_done:
+            return
         if self._client:
             try:
                 self._client.flush()
             except Exception as e:
-                logger.error(f"Failed to flush Langfuse: {e}")
+                _errors.error("flush", e)
 
     def shutdown(self):
-        """Shutdown Langfuse client."""
+        """
+        Shutdown Langfuse client (the SDK flushes pending events itself).
+
+        Idempotent: also registered with atexit, so an explicit call during
+        application shutdown makes the exit hook a no-op.
+        """
+        if self._shutdown_done:
+            return
+        self._shutdown_done = True
+        self._active = False
         if self._client:
             try:
-                self._client.flush()
                 self._client.shutdown()
             except Exception as e:
                 logger.error(f"Failed to shutdown Langfuse: {e}")
+        if self._httpx:
+            self._httpx.close()
+            self._httpx = None
 
 
 # Global tracer instance
 _tracer: LangfuseTracer | None = None
+_tracer_lock = threading.Lock()
 
 
 def get_tracer(
@@ -398,13 +656,16 @@ def get_tracer(
     """Get or create the global Langfuse tracer."""
     global _tracer
     if _tracer is None:
-        _tracer = LangfuseTracer(
-            public_key=public_key,
-            secret_key=secret_key,
-            host=host,
-            enabled=enabled,
-        )
-        _tracer.initialize()
+        with _tracer_lock:
+            if _tracer is None:
+                tracer = LangfuseTracer(
+                    public_key=public_key,
+                    secret_key=secret_key,
+                    host=host,
+                    enabled=enabled,
+                )
+                tracer.initialize()
+                _tracer = tracer
     return _tracer
 
 
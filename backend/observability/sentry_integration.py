@@ -9,16 +9,48 @@ Provides:
 
 import logging
 import os
+import re
+import time
+from collections import Counter
 from typing import Any
 
 import sentry_sdk
-from sentry_sdk.integrations.asyncio import AsyncioIntegration
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-from sentry_sdk.integrations.logging import LoggingIntegration
-from sentry_sdk.integrations.starlette import StarletteIntegration
 
 logger = logging.getLogger(__name__)
 
+# True once init_sentry succeeded; helpers return early otherwise
+_SENTRY_ENABLED = False
+
+# True once init_sentry succeeded with performance tracing on; spans are
+# no-ops otherwise
+_TRACING_ENABLED = False
+
+# Adaptive transaction sampling: each transaction name is sampled at the
+# configured rate until it exceeds roughly TRACES_PER_MINUTE transactions a
+# minute, then scaled down to stay near that target
+TRACES_PER_MINUTE = int(os.getenv("SENTRY_TRACES_PER_MINUTE", "60"))
+_SAMPLER_WINDOW = 60.0
+_max_sample_rate = 0.0
+_txn_counts: Counter = Counter()
+_txn_rates: dict[str, float] = {}
+_window_start = 0.0
+
+# Breadcrumbs kept per scope by the SDK (it drops the oldest beyond this)
+MAX_BREADCRUMBS = 50
+
+_SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "cookie"})
+_HEALTH_RE = re.compile(r"health", re.IGNORECASE)
+
+# Transaction names of probe routes, matched as suffixes: routes are mounted
+# under /api/v1 and the "endpoint" transaction style names them by function
+_HEALTH_TRANSACTIONS = (
+    "/health",
+    "/ready",
+    "/livez",
+    "/readyz",
+    ".health_check",
+)
+
 
 def init_sentry(
     dsn: str | None = None,
@@ -35,7 +67,8 @@ def init_sentry(
         dsn: Sentry DSN (or SENTRY_DSN env var)
         environment: Environment name (development, staging, production)
         release: Release version
-        traces_sample_rate: Percentage of transactions to trace (0-1)
+        traces_sample_rate: Percentage of transactions to trace (0-1); the
+            ceiling for the adaptive per-transaction sampler
         profiles_sample_rate: Percentage of transactions to profile (0-1)
         enabled: Whether Sentry is enabled
 
@@ -53,13 +86,22 @@ def init_sentry(
         )
         return False
 
+    global _max_sample_rate
+    _max_sample_rate = min(max(traces_sample_rate, 0.0), 1.0)
+
     try:
+        # Imported here so FastAPI/Starlette are only loaded when Sentry is on
+        from sentry_sdk.integrations.asyncio import AsyncioIntegration
+        from sentry_sdk.integrations.fastapi import FastApiIntegration
+        from sentry_sdk.integrations.logging import LoggingIntegration
+        from sentry_sdk.integrations.starlette import StarletteIntegration
+
         sentry_sdk.init(
             dsn=dsn,
             environment=environment,
             release=release or os.getenv("APP_VERSION", "0.1.0"),
             # Performance monitoring
-            traces_sample_rate=traces_sample_rate,
+            traces_sampler=_sample_transaction,
             profiles_sample_rate=profiles_sample_rate,
             # Integrations
             integrations=[
@@ -67,19 +109,23 @@ def init_sentry(
                 StarletteIntegration(transaction_style="endpoint"),
                 AsyncioIntegration(),
                 LoggingIntegration(
-                    level=logging.INFO,
+                    level=logging.WARNING,
                     event_level=logging.ERROR,
                 ),
             ],
             # Additional settings
             send_default_pii=False,  # Don't send personally identifiable info
             attach_stacktrace=True,
-            max_breadcrumbs=50,
+            max_breadcrumbs=MAX_BREADCRUMBS,
             # Filter out health check noise
             before_send=_filter_events,
             before_send_transaction=_filter_transactions,
         )
 
+        global _SENTRY_ENABLED, _TRACING_ENABLED
+        _SENTRY_ENABLED = sentry_sdk.get_client().is_active()
+        _TRACING_ENABLED = _SENTRY_ENABLED and traces_sample_rate > 0.0
+
         logger.info(f"Sentry initialized (environment: {environment})")
         return True
 
@@ -91,32 +137,57 @@ def init_sentry(
 def _filter_events(event: dict, hint: dict) -> dict | None:
     """Filter out noisy or sensitive events."""
     # Filter out health check errors
-    if "exception" in event:
-        for exc in event.get("exception", {}).get("values", []):
-            if "health" in str(exc.get("value", "")).lower():
+    if event.get("transaction", "").endswith(_HEALTH_TRANSACTIONS):
+        return None
+    exception = event.get("exception")
+    if exception:
+        for exc in exception.get("values", ()):
+            value = exc.get("value")
+            if value and _HEALTH_RE.search(str(value)):
                 return None
 
     # Remove sensitive data from request
-    if "request" in event:
-        request = event["request"]
-        # Remove auth headers
-        if "headers" in request:
-            headers = request["headers"]
-            for sensitive_key in ["authorization", "x-api-key", "cookie"]:
-                if sensitive_key in headers:
-                    headers[sensitive_key] = "[Filtered]"
+    request = event.get("request")
+    if request:
+        headers = request.get("headers")
+        if headers:
+            for sensitive_key in _SENSITIVE_HEADERS & headers.keys():
+                headers[sensitive_key] = "[Filtered]"
 
     return event
 
 
 def _filter_transactions(event: dict, hint: dict) -> dict | None:
     """Filter out health check transactions."""
-    transaction_name = event.get("transaction", "")
-    if "/health" in transaction_name or "/ready" in transaction_name:
+    if event.get("transaction", "").endswith(_HEALTH_TRANSACTIONS):
         return None
     return event
 
 
+def _sample_transaction(sampling_context: dict) -> float:
+    """Sample rate for a new transaction (see TRACES_PER_MINUTE)."""
+    global _window_start
+    name = sampling_context.get("transaction_context", {}).get("name") or ""
+    if name.endswith(_HEALTH_TRANSACTIONS):
+        return 0.0
+
+    # Keep distributed traces whole
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return 1.0 if parent_sampled else 0.0
+
+    now = time.monotonic()
+    if now - _window_start >= _SAMPLER_WINDOW:
+        _txn_rates.clear()
+        for txn, count in _txn_counts.items():
+            _txn_rates[txn] = min(_max_sample_rate, TRACES_PER_MINUTE / count)
+        _txn_counts.clear()
+        _window_start = now
+
+    _txn_counts[name] += 1
+    return _txn_rates.get(name, _max_sample_rate)
+
+
 def capture_exception(
     exception: Exception,
     extra: dict | None = None,
@@ -136,13 +207,12 @@ def capture_exception(
         Event ID or None
     """
     try:
-        with sentry_sdk.push_scope() as scope:
+        with sentry_sdk.new_scope() as scope:
             if extra:
                 for key, value in extra.items():
                     scope.set_extra(key, value)
             if tags:
-                for key, value in tags.items():
-                    scope.set_tag(key, value)
+                scope.set_tags(tags)
             scope.level = level
 
             event_id = sentry_sdk.capture_exception(exception)
@@ -172,13 +242,12 @@ def capture_message(
         Event ID or None
     """
     try:
-        with sentry_sdk.push_scope() as scope:
+        with sentry_sdk.new_scope() as scope:
             if extra:
                 for key, value in extra.items():
                     scope.set_extra(key, value)
             if tags:
-                for key, value in tags.items():
-                    scope.set_tag(key, value)
+                scope.set_tags(tags)
 
             event_id = sentry_sdk.capture_message(message, level=level)
             return event_id
@@ -197,18 +266,28 @@ def set_user_context(
     """
     Set user context for Sentry events.
 
+    Only non-empty fields are sent; a call with none of them is a no-op.
+
     Args:
         user_id: User identifier
         email: User email
         username: Username
         ip_address: IP address
     """
-    sentry_sdk.set_user({
-        "id": user_id,
-        "email": email,
-        "username": username,
-        "ip_address": ip_address,
-    })
+    if not _SENTRY_ENABLED:
+        return
+
+    user = {}
+    if user_id:
+        user["id"] = user_id
+    if email:
+        user["email"] = email
+    if username:
+        user["username"] = username
+    if ip_address:
+        user["ip_address"] = ip_address
+    if user:
+        sentry_sdk.set_user(user)
 
 
 def clear_user_context():
@@ -225,12 +304,18 @@ def add_breadcrumb(
     """
     Add a breadcrumb for debugging.
 
+    The SDK keeps the last MAX_BREADCRUMBS and attaches them to every event,
+    including those sent by the FastAPI and logging integrations.
+
     Args:
         message: Breadcrumb message
         category: Category (e.g., "agent", "tool", "llm")
         level: Level (debug, info, warning, error)
         data: Additional data
     """
+    if not _SENTRY_ENABLED:
+        return
+
     sentry_sdk.add_breadcrumb(
         message=message,
         category=category,
@@ -249,6 +334,22 @@ def set_context(name: str, data: dict):
     sentry_sdk.set_context(name, data)
 
 
+class _NoOpSpan:
+    """Stand-in returned by SentrySpan when tracing is off."""
+
+    def set_data(self, key: str, value: Any):
+        pass
+
+    def set_tag(self, key: str, value: Any):
+        pass
+
+    def set_status(self, status: str):
+        pass
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
 class SentrySpan:
     """Context manager for Sentry performance spans."""
 
@@ -272,11 +373,14 @@ class SentrySpan:
         self._span = None
 
     def __enter__(self):
+        if not _TRACING_ENABLED:
+            return _NOOP_SPAN
+
         self._span = sentry_sdk.start_span(
             op=self.operation,
             description=self.description,
         )
-        if self._span:
+        if self._span and self.data:
             for key, value in self.data.items():
                 self._span.set_data(key, value)
         return self._span
@@ -3,18 +3,43 @@ F1 RIA Query Preprocessing Module
 
 Provides fuzzy matching, query expansion, intent classification,
 and query history/suggestions for preprocessing user queries.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+one component does not load the others.
 """
 
-from preprocessing.query_preprocessor import QueryPreprocessor, PreprocessedQuery
-from preprocessing.fuzzy_matcher import FuzzyMatcher, MatchResult
-from preprocessing.query_expander import QueryExpander, ExpandedQuery
-from preprocessing.intent_classifier import IntentClassifier, ClassifiedIntent
-from preprocessing.query_history import (
-    QueryHistoryManager,
-    QueryHistoryEntry,
-    QuerySuggestion,
-    get_history_manager,
-)
+import importlib
+
+_LAZY = {
+    "QueryPreprocessor": "preprocessing.query_preprocessor",
+    "PreprocessedQuery": "preprocessing.query_preprocessor",
+    "FuzzyMatcher": "preprocessing.fuzzy_matcher",
+    "MatchResult": "preprocessing.fuzzy_matcher",
+    "QueryExpander": "preprocessing.query_expander",
+    "ExpandedQuery": "preprocessing.query_expander",
+    "IntentClassifier": "preprocessing.intent_classifier",
+    "ClassifiedIntent": "preprocessing.intent_classifier",
+    "QueryHistoryManager": "preprocessing.query_history",
+    "QueryHistoryEntry": "preprocessing.query_history",
+    "QuerySuggestion": "preprocessing.query_history",
+    "get_history_manager": "preprocessing.query_history",
+}
+
+
+def __getattr__(name: str):
+    """Import the submodule defining ``name`` and cache the attribute."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module_name), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "QueryPreprocessor",
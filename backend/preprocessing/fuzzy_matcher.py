@@ -7,15 +7,35 @@ Handles typo correction and alias resolution for:
 - Circuit names (silverston → Silverstone)
 """
 
+import functools
 import json
 import logging
 import re
-from dataclasses import dataclass
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Per-instance memoization of match_any (by normalized token) and
+# extract_entities; user queries repeat the same names constantly
+MATCH_CACHE_SIZE = 4096
+
+# C++ Levenshtein (bit-parallel); pure-Python fallback when not installed
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    process = None
+    Levenshtein = None
+    RAPIDFUZZ_AVAILABLE = False
+    logger.info("rapidfuzz not installed; using pure-Python Levenshtein distance")
+
 
 @dataclass
 class MatchResult:
@@ -27,25 +47,174 @@ class MatchResult:
     confidence: float  # 0.0 to 1.0
 
 
-def levenshtein_distance(s1: str, s2: str) -> int:
-    """Calculate Levenshtein distance between two strings."""
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+def levenshtein_distance(s1: str, s2: str, cutoff: int | None = None) -> int:
+    """
+    Calculate Levenshtein distance between two strings.
+
+    Args:
+        s1: First string
+        s2: Second string
+        cutoff: If given, any distance above it is reported as cutoff + 1,
+            which lets the computation stop early
 
-    if len(s2) == 0:
-        return len(s1)
+    Returns:
+        Edit distance (capped at cutoff + 1 when a cutoff is given)
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.distance(s1, s2, score_cutoff=cutoff)
 
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+    # Bit-parallel kernel; the shorter string is the pattern so the bit
+    # vectors stay small
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    return _myers_distance(_pattern_masks(s2), len(s2), s1, cutoff)
+
+
+def _fold(text: str) -> str:
+    """Casefold and strip accents, so "Räikkönen" and "raikkonen" collide."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    if decomposed.isascii():
+        return decomposed
+    return unicodedata.normalize(
+        "NFC", "".join(c for c in decomposed if not unicodedata.combining(c))
+    )
+
+
+def _normalize(text: str) -> str:
+    """Normalize text for index lookups (index keys are stored this way)."""
+    return _fold(text.strip())
+
+
+def _pattern_masks(text: str) -> dict[str, int]:
+    """Bitmask of the positions of each character in text (Myers' Peq table)."""
+    masks: dict[str, int] = {}
+    for i, c in enumerate(text):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def _myers_distance(
+    masks: dict[str, int], m: int, key: str, cutoff: int | None = None
+) -> int:
+    """
+    Levenshtein distance between a pattern and key (Myers' bit-parallel algorithm).
+
+    Args:
+        masks: _pattern_masks() of the pattern
+        m: Pattern length
+        key: String to compare against
+        cutoff: If given, stop as soon as the distance must exceed it
+
+    Returns:
+        Edit distance (capped at cutoff + 1 when a cutoff is given)
+    """
+    n = len(key)
+    if cutoff is not None and abs(n - m) > cutoff:
+        return cutoff + 1
+    if m == 0:
+        return n
+
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+    # Each remaining key character lowers the score by at most one
+    remaining = n
+    for c in key:
+        remaining -= 1
+        eq = masks.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        if cutoff is not None and score - remaining > cutoff:
+            return cutoff + 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    if cutoff is not None and score > cutoff:
+        return cutoff + 1
+    return score
+
+
+def _bucket_by_length(keys) -> dict[int, list[str]]:
+    """Group keys by length, keeping their order within each bucket."""
+    buckets: dict[int, list[str]] = defaultdict(list)
+    for key in keys:
+        buckets[len(key)].append(key)
+    return dict(buckets)
+
+
+def _too_short_for_fuzzy(text: str, max_distance: int) -> bool:
+    """
+    Whether text is too short to fuzzy match meaningfully.
+
+    Within max_distance edits a short string is close to nearly every short
+    key ("a" is one insertion and two edits from "ver"), so those matches
+    are noise; only exact lookups apply.
+    """
+    return len(text) < max(3, 2 * max_distance)
+
+
+def _closest_key(
+    text: str, keys_by_len: dict[int, list[str]], max_distance: int
+) -> tuple[str, int] | None:
+    """
+    Find the key closest to text within a maximum edit distance.
+
+    The length difference is a lower bound on the distance, so only buckets
+    within max_distance of len(text) are scanned, nearest length first, and
+    the scan stops once no remaining bucket can beat the best match.
+    (A BK-tree was measured here and lost to this scan on both the rapidfuzz
+    and pure-Python paths: a tree walk pays one distance call per visited
+    node, while a bucket is one C call.)
+
+    Args:
+        text: Normalized text to match
+        keys_by_len: Candidate keys grouped by length
+        max_distance: Maximum Levenshtein distance
+
+    Returns:
+        (key, distance) of the closest key, or None if none is close enough
+        (always None for text too short to fuzzy match)
+    """
+    if _too_short_for_fuzzy(text, max_distance):
+        return None
 
-    return previous_row[-1]
+    n = len(text)
+    masks = None
+    best_key = None
+    best_distance = max_distance + 1
+
+    for delta in range(max_distance + 1):
+        if delta >= best_distance:
+            break
+        for length in (n,) if delta == 0 else (n - delta, n + delta):
+            bucket = keys_by_len.get(length)
+            if not bucket:
+                continue
+            if RAPIDFUZZ_AVAILABLE:
+                best = process.extractOne(
+                    text, bucket, scorer=Levenshtein.distance, score_cutoff=best_distance - 1
+                )
+                if best:
+                    best_key, best_distance = best[0], int(best[1])
+            else:
+                if masks is None:
+                    masks = _pattern_masks(text)
+                for key in bucket:
+                    distance = _myers_distance(masks, n, key, best_distance - 1)
+                    if distance < best_distance:
+                        best_key = key
+                        best_distance = distance
+
+    return (best_key, best_distance) if best_key is not None else None
 
 
 class FuzzyMatcher:
@@ -70,6 +239,13 @@ class FuzzyMatcher:
         # Build lookup indices
         self._build_indices()
 
+        self._match_any_cached = functools.lru_cache(maxsize=MATCH_CACHE_SIZE)(
+            self._match_any
+        )
+        self._extract_cached = functools.lru_cache(maxsize=MATCH_CACHE_SIZE)(
+            self._extract_entities
+        )
+
         logger.info(
             f"FuzzyMatcher initialized: {len(self.drivers)} drivers, "
             f"{len(self.teams)} teams, {len(self.circuits)} circuits"
@@ -106,44 +282,101 @@ class FuzzyMatcher:
             return []
 
     def _build_indices(self):
-        """Build lookup indices for fast matching."""
-        # Driver index: alias/name → driver data
-        self.driver_index: dict[str, dict] = {}
-        for driver in self.drivers:
-            code = driver.get("code", "").upper()
-            # Add code
-            self.driver_index[code.lower()] = driver
-            # Add full name
-            full_name = driver.get("full_name", "").lower()
-            self.driver_index[full_name] = driver
-            # Add first/last names
-            self.driver_index[driver.get("first_name", "").lower()] = driver
-            self.driver_index[driver.get("last_name", "").lower()] = driver
-            # Add aliases
-            for alias in driver.get("aliases", []):
-                self.driver_index[alias.lower()] = driver
-
-        # Team index: alias/name → team data
-        self.team_index: dict[str, dict] = {}
-        for team in self.teams:
+        """Build lookup indices for fast matching.
+
+        Each index maps an alias/name to a position in parallel lists of
+        canonical IDs and display names. Keys are casefolded with accents
+        stripped (display names keep them). When an alias is shared, the first
+        entity loaded keeps it (current entries load before historic ones);
+        drivers additionally prefer the one whose last name it is.
+        """
+        # Driver aliases: alias/name → every driver position using it
+        self.driver_alias_to_idxs: dict[str, list[int]] = {}
+        self.driver_codes: list[str] = []
+        self.driver_names: list[str] = []
+        last_names: list[str] = []
+        for idx, driver in enumerate(self.drivers):
+            self.driver_codes.append(driver.get("code", ""))
+            self.driver_names.append(driver.get("full_name", ""))
+            last_names.append(_fold(driver.get("last_name", "")))
+            for alias in (
+                driver.get("code", ""),
+                driver.get("full_name", ""),
+                driver.get("first_name", ""),
+                driver.get("last_name", ""),
+                *driver.get("aliases", []),
+            ):
+                key = _fold(alias)
+                if not key:
+                    continue
+                idxs = self.driver_alias_to_idxs.setdefault(key, [])
+                if idx not in idxs:
+                    idxs.append(idx)
+
+        # Driver index: alias/name → driver position
+        self.driver_index: dict[str, int] = {}
+        for key, idxs in self.driver_alias_to_idxs.items():
+            self.driver_index[key] = next(
+                (idx for idx in idxs if last_names[idx] == key), idxs[0]
+            )
+
+        # Team index: alias/name → team position
+        self.team_index: dict[str, int] = {}
+        self.team_ids: list[str] = []
+        self.team_names: list[str] = []
+        for idx, team in enumerate(self.teams):
             team_id = team.get("id", "")
-            self.team_index[team_id.lower()] = team
-            self.team_index[team.get("full_name", "").lower()] = team
-            self.team_index[team.get("short_name", "").lower()] = team
-            for alias in team.get("aliases", []):
-                self.team_index[alias.lower()] = team
-
-        # Circuit index: alias/name → circuit data
-        self.circuit_index: dict[str, dict] = {}
-        for circuit in self.circuits:
+            self.team_ids.append(team_id)
+            self.team_names.append(team.get("short_name", team.get("full_name", "")))
+            for alias in (
+                team_id,
+                team.get("full_name", ""),
+                team.get("short_name", ""),
+                *team.get("aliases", []),
+            ):
+                if alias:
+                    self.team_index.setdefault(_fold(alias), idx)
+
+        # Circuit index: alias/name → circuit position
+        self.circuit_index: dict[str, int] = {}
+        self.circuit_ids: list[str] = []
+        self.circuit_names: list[str] = []
+        for idx, circuit in enumerate(self.circuits):
             circuit_id = circuit.get("id", "")
-            self.circuit_index[circuit_id.lower()] = circuit
-            self.circuit_index[circuit.get("full_name", "").lower()] = circuit
-            self.circuit_index[circuit.get("short_name", "").lower()] = circuit
-            self.circuit_index[circuit.get("country", "").lower()] = circuit
-            self.circuit_index[circuit.get("city", "").lower()] = circuit
-            for alias in circuit.get("aliases", []):
-                self.circuit_index[alias.lower()] = circuit
+            self.circuit_ids.append(circuit_id)
+            self.circuit_names.append(
+                circuit.get("short_name", circuit.get("full_name", ""))
+            )
+            for alias in (
+                circuit_id,
+                circuit.get("full_name", ""),
+                circuit.get("short_name", ""),
+                circuit.get("country", ""),
+                circuit.get("city", ""),
+                *circuit.get("aliases", []),
+            ):
+                if alias:
+                    self.circuit_index.setdefault(_fold(alias), idx)
+
+        # Keys grouped by length for fuzzy matching
+        self.driver_keys_by_len = _bucket_by_length(self.driver_index)
+        self.team_keys_by_len = _bucket_by_length(self.team_index)
+        self.circuit_keys_by_len = _bucket_by_length(self.circuit_index)
+
+        # All keys in one row for batched matching (extract_entities), with
+        # what each column resolves to and its match_any tie-break rank
+        self._batch_keys: list[str] = []
+        self._batch_targets: list[tuple[str, int]] = []
+        self._batch_type_rank: list[int] = []
+        for rank, (entity_type, index) in enumerate((
+            ("driver", self.driver_index),
+            ("team", self.team_index),
+            ("circuit", self.circuit_index),
+        )):
+            for key, idx in index.items():
+                self._batch_keys.append(key)
+                self._batch_targets.append((entity_type, idx))
+                self._batch_type_rank.append(rank)
 
     def match_driver(self, text: str, max_distance: int = 2) -> MatchResult | None:
         """
@@ -156,49 +389,32 @@ class FuzzyMatcher:
         Returns:
             MatchResult if found, None otherwise
         """
-        text_lower = text.lower().strip()
+        return self._match_driver(text, _normalize(text), max_distance)
 
+    def _match_driver(self, text: str, key: str, max_distance: int) -> MatchResult | None:
+        """match_driver for an already normalized key."""
         # Exact match first
-        if text_lower in self.driver_index:
-            driver = self.driver_index[text_lower]
+        if key in self.driver_index:
+            idx = self.driver_index[key]
             return MatchResult(
                 original=text,
-                matched=driver.get("full_name", ""),
-                canonical=driver.get("code", ""),
+                matched=self.driver_names[idx],
+                canonical=self.driver_codes[idx],
                 entity_type="driver",
                 confidence=1.0,
             )
 
-        # Check if it's already a 3-letter code
-        if len(text_lower) == 3 and text_lower.isalpha():
-            text_upper = text_lower.upper()
-            for driver in self.drivers:
-                if driver.get("code", "").upper() == text_upper:
-                    return MatchResult(
-                        original=text,
-                        matched=driver.get("full_name", ""),
-                        canonical=driver.get("code", ""),
-                        entity_type="driver",
-                        confidence=1.0,
-                    )
-
         # Fuzzy match
-        best_match = None
-        best_distance = max_distance + 1
-
-        for key, driver in self.driver_index.items():
-            distance = levenshtein_distance(text_lower, key)
-            if distance <= max_distance and distance < best_distance:
-                best_distance = distance
-                best_match = driver
-
-        if best_match:
+        closest = _closest_key(key, self.driver_keys_by_len, max_distance)
+        if closest:
+            matched_key, best_distance = closest
+            idx = self.driver_index[matched_key]
             # Confidence decreases with distance
             confidence = 1.0 - (best_distance / (max_distance + 1))
             return MatchResult(
                 original=text,
-                matched=best_match.get("full_name", ""),
-                canonical=best_match.get("code", ""),
+                matched=self.driver_names[idx],
+                canonical=self.driver_codes[idx],
                 entity_type="driver",
                 confidence=confidence,
             )
@@ -216,35 +432,31 @@ class FuzzyMatcher:
         Returns:
             MatchResult if found, None otherwise
         """
-        text_lower = text.lower().strip()
+        return self._match_team(text, _normalize(text), max_distance)
 
+    def _match_team(self, text: str, key: str, max_distance: int) -> MatchResult | None:
+        """match_team for an already normalized key."""
         # Exact match first
-        if text_lower in self.team_index:
-            team = self.team_index[text_lower]
+        if key in self.team_index:
+            idx = self.team_index[key]
             return MatchResult(
                 original=text,
-                matched=team.get("short_name", team.get("full_name", "")),
-                canonical=team.get("id", ""),
+                matched=self.team_names[idx],
+                canonical=self.team_ids[idx],
                 entity_type="team",
                 confidence=1.0,
             )
 
         # Fuzzy match
-        best_match = None
-        best_distance = max_distance + 1
-
-        for key, team in self.team_index.items():
-            distance = levenshtein_distance(text_lower, key)
-            if distance <= max_distance and distance < best_distance:
-                best_distance = distance
-                best_match = team
-
-        if best_match:
+        closest = _closest_key(key, self.team_keys_by_len, max_distance)
+        if closest:
+            matched_key, best_distance = closest
+            idx = self.team_index[matched_key]
             confidence = 1.0 - (best_distance / (max_distance + 1))
             return MatchResult(
                 original=text,
-                matched=best_match.get("short_name", best_match.get("full_name", "")),
-                canonical=best_match.get("id", ""),
+                matched=self.team_names[idx],
+                canonical=self.team_ids[idx],
                 entity_type="team",
                 confidence=confidence,
             )
@@ -262,35 +474,31 @@ class FuzzyMatcher:
         Returns:
             MatchResult if found, None otherwise
         """
-        text_lower = text.lower().strip()
+        return self._match_circuit(text, _normalize(text), max_distance)
 
+    def _match_circuit(self, text: str, key: str, max_distance: int) -> MatchResult | None:
+        """match_circuit for an already normalized key."""
         # Exact match first
-        if text_lower in self.circuit_index:
-            circuit = self.circuit_index[text_lower]
+        if key in self.circuit_index:
+            idx = self.circuit_index[key]
             return MatchResult(
                 original=text,
-                matched=circuit.get("short_name", circuit.get("full_name", "")),
-                canonical=circuit.get("id", ""),
+                matched=self.circuit_names[idx],
+                canonical=self.circuit_ids[idx],
                 entity_type="circuit",
                 confidence=1.0,
             )
 
         # Fuzzy match
-        best_match = None
-        best_distance = max_distance + 1
-
-        for key, circuit in self.circuit_index.items():
-            distance = levenshtein_distance(text_lower, key)
-            if distance <= max_distance and distance < best_distance:
-                best_distance = distance
-                best_match = circuit
-
-        if best_match:
+        closest = _closest_key(key, self.circuit_keys_by_len, max_distance)
+        if closest:
+            matched_key, best_distance = closest
+            idx = self.circuit_index[matched_key]
             confidence = 1.0 - (best_distance / (max_distance + 1))
             return MatchResult(
                 original=text,
-                matched=best_match.get("short_name", best_match.get("full_name", "")),
-                canonical=best_match.get("id", ""),
+                matched=self.circuit_names[idx],
+                canonical=self.circuit_ids[idx],
                 entity_type="circuit",
                 confidence=confidence,
             )
@@ -308,21 +516,64 @@ class FuzzyMatcher:
             max_distance: Maximum Levenshtein distance for fuzzy matching
 
         Returns:
-            MatchResult if found, None otherwise
+            MatchResult if found, None otherwise (cached and shared;
+            treat as read-only)
         """
+        # Cache on the normalized token so every spelling of a name shares
+        # one entry; only `original` depends on the raw text
+        result = self._match_any_cached(_normalize(text), max_distance)
+        if result is not None and result.original != text:
+            result = replace(result, original=text)
+        return result
+
+    def _exact_match(self, text: str, key: str) -> MatchResult | None:
+        """Exact index hit for a normalized key (driver, then team, then circuit)."""
+        if key in self.driver_index:
+            return self._match_driver(text, key, 0)
+        if key in self.team_index:
+            return self._match_team(text, key, 0)
+        if key in self.circuit_index:
+            return self._match_circuit(text, key, 0)
+        return None
+
+    def _make_result(
+        self, entity_type: str, idx: int, text: str, confidence: float
+    ) -> MatchResult:
+        """Build a MatchResult for the entity at idx."""
+        if entity_type == "driver":
+            matched, canonical = self.driver_names[idx], self.driver_codes[idx]
+        elif entity_type == "team":
+            matched, canonical = self.team_names[idx], self.team_ids[idx]
+        else:
+            matched, canonical = self.circuit_names[idx], self.circuit_ids[idx]
+        return MatchResult(
+            original=text,
+            matched=matched,
+            canonical=canonical,
+            entity_type=entity_type,
+            confidence=confidence,
+        )
+
+    def _match_any(self, key: str, max_distance: int) -> MatchResult | None:
+        """Uncached match_any for an already normalized key."""
+        # Exact hits win outright; skip every fuzzy pass (same precedence)
+        exact = self._exact_match(key, key)
+        if exact:
+            return exact
+
         # Try driver first (most common)
-        result = self.match_driver(text, max_distance)
+        result = self._match_driver(key, key, max_distance)
         if result and result.confidence >= 0.7:
             return result
 
         # Try team
-        team_result = self.match_team(text, max_distance)
+        team_result = self._match_team(key, key, max_distance)
         if team_result:
             if result is None or team_result.confidence > result.confidence:
                 result = team_result
 
         # Try circuit
-        circuit_result = self.match_circuit(text, max_distance)
+        circuit_result = self._match_circuit(key, key, max_distance)
         if circuit_result:
             if result is None or circuit_result.confidence > result.confidence:
                 result = circuit_result
@@ -339,6 +590,10 @@ class FuzzyMatcher:
         Returns:
             List of matched entities
         """
+        return list(self._extract_cached(text))
+
+    def _extract_entities(self, text: str) -> list[MatchResult]:
+        """Uncached extract_entities."""
         results = []
 
         # Split text into words and try to match each
@@ -347,22 +602,22 @@ class FuzzyMatcher:
         # Also try consecutive word pairs (for names like "Max Verstappen")
         word_pairs = [f"{words[i]} {words[i+1]}" for i in range(len(words) - 1)]
 
-        # Try pairs first (longer matches)
+        # Try pairs first (longer matches). At max_distance=1 only an exact
+        # hit reaches the 0.8 bar, so no fuzzy pass is needed
         matched_indices = set()
         for i, pair in enumerate(word_pairs):
-            result = self.match_any(pair, max_distance=1)
-            if result and result.confidence >= 0.8:
+            result = self._exact_match(pair, _normalize(pair))
+            if result:
                 results.append(result)
                 matched_indices.add(i)
                 matched_indices.add(i + 1)
 
         # Then try individual words
-        for i, word in enumerate(words):
-            if i in matched_indices:
-                continue
-            if len(word) < 2:
-                continue
-            result = self.match_any(word, max_distance=2)
+        remaining = [
+            word for i, word in enumerate(words)
+            if i not in matched_indices and len(word) >= 2
+        ]
+        for result in self._match_words(remaining):
             if result and result.confidence >= 0.6:
                 results.append(result)
 
@@ -377,6 +632,62 @@ class FuzzyMatcher:
 
         return unique_results
 
+    def _match_words(self, words: list[str]) -> list[MatchResult | None]:
+        """
+        match_any(word, max_distance=2) for each word, batched.
+
+        At max_distance=2 a fuzzy match scores 1 - d/3, so only distance 1
+        clears extract_entities' 0.6 bar; words without an exact hit are
+        compared against every key in one rapidfuzz cdist call with that
+        cutoff. Farther matches are returned as None.
+
+        Args:
+            words: Words to match
+
+        Returns:
+            One MatchResult or None per word
+        """
+        keys = [_normalize(word) for word in words]
+        results = [self._exact_match(word, key) for word, key in zip(words, keys, strict=True)]
+        pending = [
+            i for i, result in enumerate(results)
+            if result is None and not _too_short_for_fuzzy(keys[i], 2)
+        ]
+        if not pending or not self._batch_keys:
+            return results
+
+        if not RAPIDFUZZ_AVAILABLE:
+            for i in pending:
+                results[i] = self.match_any(words[i], max_distance=2)
+            return results
+
+        distances = process.cdist(
+            [keys[i] for i in pending],
+            self._batch_keys,
+            scorer=Levenshtein.distance,
+            score_cutoff=1,
+            dtype=np.int32,
+        )
+        for i, row in zip(pending, distances, strict=True):
+            best = int(row.min())
+            if best > 1:
+                continue
+            # Same winner as match_any: entity type order, then the key
+            # nearest in length (shorter first), then index order
+            n = len(keys[i])
+            col = min(
+                np.flatnonzero(row == best),
+                key=lambda c: (
+                    self._batch_type_rank[c],
+                    abs(len(self._batch_keys[c]) - n),
+                    len(self._batch_keys[c]) > n,
+                    c,
+                ),
+            )
+            entity_type, idx = self._batch_targets[col]
+            results[i] = self._make_result(entity_type, idx, words[i], 1.0 - best / 3)
+        return results
+
     def get_driver_code(self, name: str) -> str | None:
         """Get driver code from name/alias."""
         result = self.match_driver(name)
@@ -7,13 +7,27 @@ Pre-LLM classification to:
 - Reduce token usage for obvious queries
 """
 
+import functools
+import heapq
 import re
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Literal
 
 logger = logging.getLogger(__name__)
 
+# Memoized classify() results per classifier
+CLASSIFY_CACHE_SIZE = 4096
+
+# Hyperscan (optional - x86 only): scans the query once for every pattern
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
 
 @dataclass
 class ClassifiedIntent:
@@ -171,18 +185,153 @@ INTENT_PATTERNS = {
 }
 
 
+# Hint patterns used by _build_hints
+_SEASON_RE = re.compile(r"\bseason\b")
+_RACE_RE = re.compile(r"\brace\b|\bgp\b")
+_LAP_RE = re.compile(r"\blap\b|\bsector\b")
+_TEAM_RE = re.compile(r"\bteam\b|\bconstructor\b")
+
+# Literal whole-word patterns: \bword\b, \b(?:a|b)\b and \ba\b|\bb\b
+_WORD_RE = re.compile(r"\w+")
+_LITERAL_ALT = re.compile(r"\\b(\w+)\\b")
+_LITERAL_GROUP = re.compile(r"\\b\(\?:(\w+(?:\|\w+)*)\)\\b")
+
+
+def _literal_words(pattern: str) -> frozenset[str] | None:
+    """
+    Words a pattern matches, if it only matches whole literal words.
+
+    Such a pattern matches a query exactly when one of the words is one
+    of the query's \\w+ tokens, so a set lookup can replace the regex.
+
+    Args:
+        pattern: Regex source from INTENT_PATTERNS
+
+    Returns:
+        The lowercased words, or None for any other pattern
+    """
+    group = _LITERAL_GROUP.fullmatch(pattern)
+    if group:
+        return frozenset(group.group(1).lower().split("|"))
+
+    words = []
+    for alternative in pattern.split("|"):
+        literal = _LITERAL_ALT.fullmatch(alternative)
+        if not literal:
+            return None
+        words.append(literal.group(1).lower())
+    return frozenset(words)
+
+
 class IntentClassifier:
     """Fast pre-LLM intent classifier."""
 
     def __init__(self):
         """Initialize the classifier."""
-        # Pre-compile patterns for efficiency
-        self.compiled_patterns = {}
+        # Whole-word literal patterns become word sets checked against the
+        # query's tokens; only the rest go through the regex engine
+        self.intent_literals: dict[str, list[frozenset[str]]] = {}
+        self.intent_regex: dict[str, list[re.Pattern]] = {}
+        # One alternation of the regex patterns per intent: a single search
+        # rules out intents with no matching pattern, which is most of them
+        self.intent_re = {}
+        # Patterns per intent and declaration order (breaks score ties)
+        self.pattern_counts: dict[str, int] = {}
+        self._intent_rank: dict[str, int] = {}
         for intent, config in INTENT_PATTERNS.items():
-            self.compiled_patterns[intent] = [
-                re.compile(p, re.IGNORECASE)
-                for p in config["patterns"]
-            ]
+            if config["patterns"]:
+                self._intent_rank[intent] = len(self.pattern_counts)
+                self.pattern_counts[intent] = len(config["patterns"])
+
+                literals, regex = [], []
+                for p in config["patterns"]:
+                    words = _literal_words(p)
+                    if words is not None:
+                        literals.append(words)
+                    else:
+                        regex.append(p)
+                self.intent_literals[intent] = literals
+                self.intent_regex[intent] = [re.compile(p, re.IGNORECASE) for p in regex]
+                if regex:
+                    self.intent_re[intent] = re.compile(
+                        "|".join(f"(?:{p})" for p in regex), re.IGNORECASE
+                    )
+
+        self._hs_db = None
+        self._hs_intents: list[str] = []
+        self._hs_local = threading.local()
+        if HYPERSCAN_AVAILABLE:
+            self._compile_hyperscan()
+
+        self._classify_cached = functools.lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(
+            self._classify
+        )
+
+    def _compile_hyperscan(self):
+        """Compile all intent patterns into one Hyperscan database."""
+        expressions = []
+        for intent, config in INTENT_PATTERNS.items():
+            for pattern in config["patterns"]:
+                expressions.append(pattern.encode())
+                self._hs_intents.append(intent)
+
+        try:
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                # SINGLEMATCH: each pattern reports at most once, which is
+                # exactly the per-pattern count classify() scores on. No UCP:
+                # Hyperscan rejects \b there, so word boundaries are ASCII and
+                # only ASCII queries are scanned
+                flags=(
+                    hyperscan.HS_FLAG_CASELESS
+                    | hyperscan.HS_FLAG_SINGLEMATCH
+                    | hyperscan.HS_FLAG_UTF8
+                ),
+            )
+            self._hs_db = db
+        except Exception as e:
+            logger.warning(f"Hyperscan compile failed, using regex matching: {e}")
+
+    def _count_matches(self, query_lower: str) -> dict[str, int]:
+        """Number of matching patterns per matched intent, in declaration order."""
+        matched: dict[str, int] = {}
+
+        # Hyperscan's \b is ASCII-only (no UCP), so non-ASCII queries (which
+        # also covers lone surrogates that cannot be encoded) use the regex
+        # path to keep results identical
+        if self._hs_db is not None and query_lower.isascii():
+            # Scratch space is per thread; it cannot be shared by concurrent scans
+            scratch = getattr(self._hs_local, "scratch", None)
+            if scratch is None:
+                scratch = self._hs_local.scratch = hyperscan.Scratch(self._hs_db)
+            intents = self._hs_intents
+
+            def on_match(pattern_id, start, end, flags, context):
+                intent = intents[pattern_id]
+                matched[intent] = matched.get(intent, 0) + 1
+
+            self._hs_db.scan(query_lower.encode(), match_event_handler=on_match, scratch=scratch)
+            # Matches arrive in text order
+            if len(matched) > 1:
+                matched = dict(sorted(matched.items(), key=lambda kv: self._intent_rank[kv[0]]))
+            return matched
+
+        tokens = set(_WORD_RE.findall(query_lower))
+        for intent in self.pattern_counts:
+            count = 0
+            for words in self.intent_literals[intent]:
+                if not words.isdisjoint(tokens):
+                    count += 1
+            intent_re = self.intent_re.get(intent)
+            if intent_re is not None and intent_re.search(query_lower):
+                for pattern in self.intent_regex[intent]:
+                    if pattern.search(query_lower):
+                        count += 1
+            if count:
+                matched[intent] = count
+        return matched
 
     def classify(self, query: str) -> ClassifiedIntent:
         """
@@ -192,30 +341,30 @@ class IntentClassifier:
             query: User query
 
         Returns:
-            ClassifiedIntent with suggested tools and hints
+            ClassifiedIntent with suggested tools and hints (cached and
+            shared; treat as read-only)
         """
-        query_lower = query.lower()
+        return self._classify_cached(query)
 
-        # Score each intent
-        scores: dict[str, float] = {}
-
-        for intent, patterns in self.compiled_patterns.items():
-            score = 0.0
-            matches = 0
+    def _classify(self, query: str) -> ClassifiedIntent:
+        """Uncached classify."""
+        query_lower = query.lower()
 
-            for pattern in patterns:
-                if pattern.search(query_lower):
-                    matches += 1
-                    score += 1.0
+        # Score each matched intent: normalize by number of patterns, but
+        # reward multiple matches. Intents with no match would score 0 and
+        # can never be chosen, so they are skipped
+        scores: dict[str, float] = {
+            intent: (matches / self.pattern_counts[intent]) * (1 + matches * 0.1)
+            for intent, matches in self._count_matches(query_lower).items()
+        }
 
-            if patterns:  # Avoid division by zero
-                # Normalize by number of patterns, but reward multiple matches
-                scores[intent] = (score / len(patterns)) * (1 + matches * 0.1)
+        # Rank once: the top entry is the best intent, the rest feed the hints
+        # (nlargest keeps first-seen order on ties, like max/sorted)
+        top = heapq.nlargest(3, scores.items(), key=lambda x: x[1])
 
         # Get best intent
-        if scores:
-            best_intent = max(scores, key=lambda k: scores[k])
-            best_score = scores[best_intent]
+        if top:
+            best_intent, best_score = top[0]
         else:
             best_intent = "general"
             best_score = 0.0
@@ -228,7 +377,7 @@ class IntentClassifier:
         config = INTENT_PATTERNS[best_intent]
 
         # Build hints for the LLM
-        hints = self._build_hints(query, best_intent, scores)
+        hints = self._build_hints(query, best_intent, top)
 
         return ClassifiedIntent(
             intent=best_intent,
@@ -242,15 +391,13 @@ class IntentClassifier:
         self,
         query: str,
         primary_intent: str,
-        scores: dict[str, float]
+        top: list[tuple[str, float]]
     ) -> dict:
-        """Build hints to help the LLM."""
+        """Build hints to help the LLM (top: three best-scored intents)."""
         hints = {
             "primary_intent": primary_intent,
             "secondary_intents": [
-                intent for intent, score in sorted(
-                    scores.items(), key=lambda x: x[1], reverse=True
-                )[:3]
+                intent for intent, score in top
                 if score > 0.2 and intent != primary_intent
             ],
         }
@@ -259,16 +406,16 @@ class IntentClassifier:
         query_lower = query.lower()
 
         # Season detection
-        if re.search(r"\bseason\b", query_lower):
+        if _SEASON_RE.search(query_lower):
             hints["scope"] = "full_season"
-        elif re.search(r"\brace\b|\bgp\b", query_lower):
+        elif _RACE_RE.search(query_lower):
             hints["scope"] = "full_race"
-        elif re.search(r"\blap\b|\bsector\b", query_lower):
+        elif _LAP_RE.search(query_lower):
             hints["scope"] = "single_lap"
 
         # Comparison detection
         if primary_intent == "comparison":
-            if re.search(r"\bteam\b|\bconstructor\b", query_lower):
+            if _TEAM_RE.search(query_lower):
                 hints["comparison_type"] = "team"
             else:
                 hints["comparison_type"] = "driver"
@@ -7,6 +7,7 @@ Features:
 - Track popular queries and trends
 """
 
+import asyncio
 import json
 import logging
 import hashlib
@@ -510,6 +511,7 @@ class QueryHistoryManager:
 
 # Singleton instance
 _history_manager: QueryHistoryManager | None = None
+_history_manager_lock = asyncio.Lock()
 
 
 async def get_history_manager(
@@ -518,6 +520,9 @@ async def get_history_manager(
     """Get or create the singleton history manager."""
     global _history_manager
     if _history_manager is None:
-        _history_manager = QueryHistoryManager(redis_url)
-        await _history_manager.initialize()
+        async with _history_manager_lock:
+            if _history_manager is None:
+                manager = QueryHistoryManager(redis_url)
+                await manager.initialize()
+                _history_manager = manager
     return _history_manager
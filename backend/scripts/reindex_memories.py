@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Reindex User Memories
+
+Re-embeds memories stored with the old 768-D nomic-embed-text model into the
+384-D all-minilm collection used by UserMemory.
+Run inside the backend container: docker compose exec backend python scripts/reindex_memories.py
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from memory.user_memory import UserMemory
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger(__name__)
+
+SOURCE_COLLECTION = "user_memories"
+
+
+async def main():
+    """Copy memories from the legacy collection into the current one."""
+    user_memory = UserMemory(
+        qdrant_host=os.getenv("QDRANT_HOST", "qdrant"),
+        qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
+        llm_config={"ollama_base_url": os.getenv("OLLAMA_BASE_URL", "http://ollama:11434")},
+    )
+    user_memory.initialize()
+
+    copied = await user_memory.reindex_from(SOURCE_COLLECTION)
+
+    print("\n" + "=" * 60)
+    print("REINDEX COMPLETE")
+    print("=" * 60)
+    print(f"  {SOURCE_COLLECTION} -> {user_memory.collection_name}: {copied} memories")
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
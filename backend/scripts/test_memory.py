@@ -146,13 +146,8 @@ async def test_user_memory():
             limit=5,
         )
         print(f"✓ Found {len(memories)} memories for 'favorite driver'")
-        for mem in memories:
-            # Handle both string and dict return types
-            if isinstance(mem, str):
-                print(f"  - {mem}")
-            else:
-                memory_text = mem.get("memory", mem.get("text", str(mem)))
-                print(f"  - {memory_text}")
+        for memory_text, score in memories:
+            print(f"  - {memory_text} ({score:.2f})")
 
         # Test getting all memories
         all_memories = await user_memory.get_all_memories(user_id)
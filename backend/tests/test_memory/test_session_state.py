@@ -0,0 +1,116 @@
+"""
+Tests for the Redis session hash layout.
+"""
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs it for EVAL
+pytest.importorskip("mem0")  # imported by the memory package
+
+from redis.asyncio.connection import AbstractConnection  # noqa: E402
+
+from memory.session_state import SessionState  # noqa: E402
+
+
+@pytest.fixture
+async def state():
+    """SessionState backed by an in-process fake Redis."""
+    session_state = SessionState()
+    session_state._client = fakeredis.FakeAsyncRedis()
+    yield session_state
+    await session_state.close()
+
+
+class TestSessionHash:
+    """Tests for session fields stored as a Redis hash."""
+
+    async def test_create_and_get_round_trip(self, state):
+        """Test that get_session returns what create_session stored."""
+        created = await state.create_session("s1", user_id="u1", metadata={"team": "ferrari"})
+        assert await state.get_session("s1") == created
+
+    async def test_user_id_none_round_trips(self, state):
+        """Test that a missing user_id comes back as None."""
+        await state.create_session("s1")
+        session = await state.get_session("s1")
+        assert session["user_id"] is None
+        assert session["metadata"] == {}
+
+    async def test_update_preserves_types(self, state):
+        """Test that dict, bool, int and list fields keep their types."""
+        await state.create_session("s1")
+        updates = {
+            "preferences": {"units": "metric"},
+            "verbose": True,
+            "favourite_number": 44,
+            "drivers": ["HAM", "VER"],
+        }
+        updated = await state.update_session("s1", updates)
+        assert {k: updated[k] for k in updates} == updates
+        session = await state.get_session("s1")
+        assert {k: session[k] for k in updates} == updates
+
+    async def test_update_missing_session(self, state):
+        """Test that updating an unknown session does not create it."""
+        assert await state.update_session("missing", {"verbose": True}) is None
+        assert await state.get_session("missing") is None
+
+
+class TestAddMessages:
+    """Tests for message writes against the session hash."""
+
+    async def test_increments_message_count(self, state):
+        """Test that messages bump message_count and last_activity."""
+        await state.create_session("s1", user_id="u1")
+        await state.add_message("s1", "user", "Who won Monaco?")
+        await state.add_messages("s1", [
+            {"role": "assistant", "content": "Leclerc"},
+            {"role": "user", "content": "Thanks"},
+        ])
+
+        session = await state.get_session("s1")
+        assert session["message_count"] == 3
+        assert session["user_id"] == "u1"
+        assert isinstance(session["last_activity"], str)
+        assert len(await state.get_history("s1")) == 3
+
+    async def test_does_not_create_session(self, state):
+        """Test that messages to an unknown session leave it absent."""
+        await state.add_message("ghost", "user", "hello")
+        assert await state.get_session("ghost") is None
+        assert "ghost" not in await state.get_active_sessions()
+
+    async def test_does_not_resurrect_deleted_session(self, state):
+        """Test that a deleted session stays deleted after a late message."""
+        await state.create_session("s1")
+        await state.delete_session("s1")
+        await state.add_message("s1", "user", "late message")
+        assert await state.get_session("s1") is None
+        assert "s1" not in await state.get_active_sessions()
+
+    async def test_single_round_trip(self, state, monkeypatch):
+        """Test that a message write sends one packet to Redis."""
+        await state.create_session("s1")
+        sent = []
+        send = AbstractConnection.send_packed_command
+
+        async def record(self, command, check_health=True):
+            sent.append(command)
+            return await send(self, command, check_health)
+
+        monkeypatch.setattr(AbstractConnection, "send_packed_command", record)
+        await state.add_message("s1", "user", "hello")
+        await state.add_message("s1", "user", "again")
+        assert len(sent) == 2
+        assert (await state.get_session("s1"))["message_count"] == 2
+
+
+class TestContextHash:
+    """Tests for session context stored as a Redis hash."""
+
+    async def test_legacy_string_key_ignored(self, state):
+        """Test that a pre-hash JSON context key does not break context calls."""
+        await state._client.set("f1:context:s1", b'{"driver": "HAM"}')
+        await state.update_context("s1", {"driver": "VER"})
+        assert await state.get_context("s1") == {"driver": "VER"}
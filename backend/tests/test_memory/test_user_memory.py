@@ -0,0 +1,90 @@
+"""
+Tests for memory writes and the semantic context cache.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mem0")  # imported by the memory package
+
+from memory.user_memory import EmbeddingCache, UserMemory  # noqa: E402
+
+MESSAGES = [{"role": "user", "content": "I support Ferrari"}]
+
+
+class TestEnqueueMemory:
+    """Tests that every batched caller is resolved."""
+
+    async def test_initialize_failure_returns_empty(self, monkeypatch):
+        """Test that an unreachable backend resolves waiters with no memories."""
+        memory = UserMemory()
+
+        def fail():
+            raise ConnectionError("qdrant unreachable")
+
+        monkeypatch.setattr(memory, "initialize", fail)
+        assert await asyncio.wait_for(memory.enqueue_memory("u1", MESSAGES), 2) == []
+
+    async def test_batch_error_reaches_every_waiter(self, monkeypatch):
+        """Test that an error in the batch add is raised to each caller."""
+        memory = UserMemory()
+
+        async def fail(*args, **kwargs):
+            raise ConnectionError("add failed")
+
+        monkeypatch.setattr(memory, "add_memory", fail)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                memory.enqueue_memory("u1", MESSAGES),
+                memory.enqueue_memory("u1", MESSAGES),
+                return_exceptions=True,
+            ),
+            2,
+        )
+        assert [type(result) for result in results] == [ConnectionError, ConnectionError]
+
+
+class TestGetUserContext:
+    """Tests for caching formatted user context."""
+
+    @pytest.fixture
+    def memory(self, monkeypatch):
+        """UserMemory with the embedder and semantic cache stubbed out."""
+        memory = UserMemory()
+        monkeypatch.setattr(
+            memory, "_embed_query", AsyncMock(return_value=np.ones(4, dtype=np.int8))
+        )
+        monkeypatch.setattr(memory, "_semantic_lookup", AsyncMock(return_value=None))
+        monkeypatch.setattr(memory, "_semantic_store", AsyncMock())
+        return memory
+
+    async def test_empty_search_not_cached(self, memory, monkeypatch):
+        """Test that an empty (possibly failed) search is not cached."""
+        monkeypatch.setattr(memory, "search_memories", AsyncMock(return_value=[]))
+        assert await memory.get_user_context("u1", "favourite team?") == ""
+        memory._semantic_store.assert_not_awaited()
+
+    async def test_found_memories_cached(self, memory, monkeypatch):
+        """Test that a non-empty context is cached."""
+        monkeypatch.setattr(
+            memory, "search_memories", AsyncMock(return_value=[("Supports Ferrari", 0.9)])
+        )
+        context = await memory.get_user_context("u1", "favourite team?")
+        assert "Supports Ferrari" in context
+        memory._semantic_store.assert_awaited_once()
+
+
+class TestEmbeddingCache:
+    """Tests for the shared query embedding cache."""
+
+    def test_namespaces_do_not_share_vectors(self):
+        """Test that embedders with different models keep separate entries."""
+        cache = EmbeddingCache()
+        small = cache.wrap(lambda text, memory_action=None: [0.0] * 384, "all-minilm:384")
+        large = cache.wrap(lambda text, memory_action=None: [0.0] * 768, "nomic:768")
+        assert len(small("pit stop")) == 384
+        assert len(large("pit stop")) == 768
+        assert len(small("pit stop")) == 384
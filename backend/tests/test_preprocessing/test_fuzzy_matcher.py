@@ -0,0 +1,82 @@
+"""
+Tests for fuzzy entity matching.
+"""
+
+import json
+
+import pytest
+
+from preprocessing import fuzzy_matcher
+from preprocessing.fuzzy_matcher import FuzzyMatcher
+
+DRIVERS = {
+    "drivers": [
+        {"code": "NOR", "first_name": "Lando", "last_name": "Norris", "full_name": "Lando Norris"},
+        {"code": "HAM", "first_name": "Lewis", "last_name": "Hamilton", "full_name": "Lewis Hamilton"},
+        {"code": "PER", "first_name": "Sergio", "last_name": "Pérez", "full_name": "Sergio Pérez"},
+        {"code": "ALB", "first_name": "Alex", "last_name": "Albon", "full_name": "Alex Albon"},
+    ],
+    "historic_drivers": [
+        {"code": "NRI", "first_name": "Nino", "last_name": "Norri", "full_name": "Nino Norri"},
+        {
+            "code": "HMA",
+            "first_name": "Lucas",
+            "last_name": "Hamiltan",
+            "full_name": "Lucas Hamiltan",
+            "aliases": ["alboonx"],
+        },
+    ],
+}
+
+TEAMS = {
+    "teams": [
+        {"id": "red_bull", "full_name": "Red Bull Racing", "short_name": "Red Bull", "aliases": ["redbul", "norr"]},
+    ],
+}
+
+CIRCUITS = {
+    "circuits": [
+        {"id": "red_bull_ring", "full_name": "Red Bull Ring", "short_name": "Spielberg", "aliases": ["redbulk"]},
+    ],
+}
+
+# Words with several candidates at the same distance: same type at equal
+# and different lengths, and across entity types
+WORDS = [
+    "norrs",     # driver "norri" (same length) vs "norris" vs team "norr"
+    "hamiltun",  # drivers "hamilton" vs "hamiltan" (index order)
+    "alboon",    # driver "albon" (shorter) vs "alboonx" (longer)
+    "redbuls",   # team "redbul" vs circuit "redbulk"
+    "perex",     # accent-folded "perez"
+    "Norris",    # exact hit
+    "spielbrg",  # circuit only
+    "hmt",       # too short to fuzzy match
+    "qwertyuiop",
+]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Directory with small driver, team and circuit data files."""
+    for name, data in (("drivers", DRIVERS), ("teams", TEAMS), ("circuits", CIRCUITS)):
+        (tmp_path / f"{name}.json").write_text(json.dumps(data))
+    return tmp_path
+
+
+class TestMatchWords:
+    """Tests that batched word matching agrees with match_any."""
+
+    @pytest.mark.parametrize("rapidfuzz", [True, False])
+    def test_matches_match_any_on_ties(self, data_dir, monkeypatch, rapidfuzz):
+        """Test that _match_words picks the same winner as match_any."""
+        if rapidfuzz and not fuzzy_matcher.RAPIDFUZZ_AVAILABLE:
+            pytest.skip("rapidfuzz not installed")
+        monkeypatch.setattr(fuzzy_matcher, "RAPIDFUZZ_AVAILABLE", rapidfuzz)
+        matcher = FuzzyMatcher(data_dir)
+
+        expected = []
+        for word in WORDS:
+            result = matcher.match_any(word, max_distance=2)
+            expected.append(result if result and result.confidence >= 0.6 else None)
+        assert matcher._match_words(WORDS) == expected
+        assert any(result is not None for result in expected)
@@ -0,0 +1,57 @@
+"""
+Tests for intent classification.
+"""
+
+import pytest
+
+from preprocessing import intent_classifier
+from preprocessing.intent_classifier import IntentClassifier
+
+QUERIES = [
+    "Who won the 2023 Monaco GP?",
+    "championship standings",
+    "pit stop duration for Red Bull",
+    "Verstappen vs Hamilton lap times at Silverstone",
+    "Soft tyre deg in the race and lap 12 sector 2",
+    "passé strategy",
+    "Verstappen v. é Hamilton pace",
+    "x\ud800 pit stop",
+]
+
+
+def _summary(result):
+    return (
+        result.intent,
+        round(result.confidence, 6),
+        result.hints.get("secondary_intents"),
+    )
+
+
+@pytest.fixture
+def regex_classifier():
+    """Classifier forced onto the pure-regex path."""
+    classifier = IntentClassifier()
+    classifier._hs_db = None
+    return classifier
+
+
+class TestMatchingPaths:
+    """Tests that every matching path classifies identically."""
+
+    @pytest.mark.skipif(
+        not intent_classifier.HYPERSCAN_AVAILABLE, reason="hyperscan not installed"
+    )
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_hyperscan_matches_regex(self, regex_classifier, query):
+        """Test that the Hyperscan path agrees with the regex path."""
+        assert _summary(IntentClassifier().classify(query)) == _summary(
+            regex_classifier.classify(query)
+        )
+
+    def test_non_ascii_word_boundary(self, regex_classifier):
+        """Test that an accented letter is part of the word (no 'pass' match)."""
+        assert regex_classifier.classify("passé strategy").intent == "general"
+
+    def test_lone_surrogate(self):
+        """Test that undecodable input from JSON bodies does not crash."""
+        assert IntentClassifier().classify("x\ud800 pit stop").intent == "pit_stops"